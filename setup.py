@@ -29,6 +29,13 @@ setup(
         "Programming Language :: Python :: 3.11",
     ],
     python_requires=">=3.7",
-    install_requires=requirements
+    install_requires=requirements,
+    extras_require={
+        # Test runner plugins, not needed to use the library
+        "test": [
+            "pytest-xdist>=3.3.0",
+            "pytest-testmon>=2.1.0",
+        ],
+    }
 )
 
@@ -13,6 +13,7 @@ from .generic import (
     TerraformDocExtractor,
     TerraformURL,
     PageFetcher,
+    FetcherPool,
     DocumentationParser
 )
 
@@ -29,6 +30,7 @@ __all__ = [
     "TerraformDocExtractor",
     "TerraformURL",
     "PageFetcher",
+    "FetcherPool",
     "DocumentationParser",
     # Specialized
     "ExampleUsageExtractor",
@@ -2,13 +2,23 @@
 
 import sys
 import json
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 import click
 from loguru import logger
 
 from .generic.extractor import TerraformDocExtractor
 
 
+# Buffer size for output files, so large results are written in few syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Encoder for --format json, streamed so the output is never held as one string
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Default number of pages fetched at once by the batch command
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
 def setup_logging(verbose: bool):
     """Configure logging based on verbosity."""
     logger.remove()
@@ -27,6 +37,102 @@ def setup_logging(verbose: bool):
         )
 
 
+def iter_sections_output(
+    result: Dict[str, Optional[str]],
+    output_format: str
+) -> Iterator[str]:
+    """
+    Render extracted sections as a stream of output chunks.
+    
+    Args:
+        result: Dict mapping section names to their content
+        output_format: One of 'json', 'html' or 'text'
+        
+    Yields:
+        Consecutive pieces of the rendered output
+    """
+    if output_format == 'json':
+        yield from _JSON_ENCODER.iterencode(result)
+        return
+    
+    if output_format == 'html':
+        template = '<!-- Section: {name} -->\n{content}'
+    else:
+        template = '=== {name} ===\n{content}'
+    
+    separator = ''
+    for name, content in result.items():
+        if content:
+            yield separator
+            yield template.format(name=name, content=content)
+            separator = '\n\n'
+
+
+def iter_batch_output(
+    results: Dict[str, Union[Dict[str, Optional[str]], Optional[str]]],
+    key: str
+) -> Iterator[str]:
+    """
+    Render batch results as newline-delimited JSON, one object per URL.
+    
+    Args:
+        results: Dict mapping each URL to its extracted content
+        key: Name of the field holding the content ('sections' or 'documentation')
+        
+    Yields:
+        One JSON line per URL
+    """
+    separator = ''
+    for url, content in results.items():
+        yield separator
+        yield json.dumps({'url': url, key: content})
+        separator = '\n'
+
+
+def read_urls(urls: Iterable[str], urls_file) -> List[str]:
+    """
+    Collect URLs from the command line and an optional file.
+    
+    Blank lines and lines starting with '#' in the file are ignored.
+    
+    Args:
+        urls: URLs given as arguments
+        urls_file: Open file with one URL per line, or None
+        
+    Returns:
+        All URLs, command-line ones first
+    """
+    collected = list(urls)
+    if urls_file is not None:
+        for line in urls_file:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                collected.append(line)
+    return collected
+
+
+def write_output(chunks: Iterable[str], output: Optional[str]):
+    """
+    Write output chunks to a file, or to stdout if no file is given.
+    
+    Chunks are written as they are produced instead of being joined into
+    one string first.
+    
+    Args:
+        chunks: Pieces of the output, in order
+        output: Output file path, or None for stdout
+    """
+    if output:
+        with open(output, 'w', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+        logger.bind(output_file=output).info("Saved output to file")
+    else:
+        stdout = click.get_text_stream('stdout')
+        stdout.writelines(chunks)
+        stdout.write('\n')
+        stdout.flush()
+
+
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.pass_context
@@ -63,8 +169,6 @@ def extract(ctx, url, sections, extract_all, text, output, output_format):
         
         $ terraform-doc-extract extract "hashicorp/aws/5.100.0/docs/resources/lb" -s "Example Usage" --text
     """
-    extractor = TerraformDocExtractor()
-    
     if not extract_all and not sections:
         click.echo("Error: Must specify either --sections or --all", err=True)
         sys.exit(1)
@@ -74,34 +178,14 @@ def extract(ctx, url, sections, extract_all, text, output, output_format):
     if output_format == 'text':
         text = True
     
-    try:
-        result = extractor.extract_sections(url, sections_list, as_text=text)
-        
-        if output_format == 'json':
-            output_data = json.dumps(result, indent=2)
-        elif output_format == 'html':
-            output_data = '\n\n'.join(
-                f'<!-- Section: {name} -->\n{content}' 
-                for name, content in result.items() 
-                if content
-            )
-        else:
-            output_data = '\n\n'.join(
-                f'=== {name} ===\n{content}' 
-                for name, content in result.items() 
-                if content
-            )
-        
-        if output:
-            with open(output, 'w') as f:
-                f.write(output_data)
-            logger.bind(output_file=output).info("Saved output to file")
-        else:
-            click.echo(output_data)
-            
-    except Exception as e:
-        logger.bind(error=str(e)).error("Failed to extract sections")
-        sys.exit(1)
+    with TerraformDocExtractor() as extractor:
+        try:
+            result = extractor.extract_sections(url, sections_list, as_text=text)
+            write_output(iter_sections_output(result, output_format), output)
+                
+        except Exception as e:
+            logger.bind(error=str(e)).error("Failed to extract sections")
+            sys.exit(1)
 
 
 @cli.command()
@@ -115,22 +199,21 @@ def list_sections(ctx, url):
     
         $ terraform-doc-extract list-sections "hashicorp/aws/5.100.0/docs/resources/lb"
     """
-    extractor = TerraformDocExtractor()
-    
-    try:
-        sections = extractor.list_available_sections(url)
-        
-        if not sections:
-            click.echo("No sections found", err=True)
-            sys.exit(1)
-        
-        click.echo("Available sections:")
-        for i, section in enumerate(sections, 1):
-            click.echo(f"  {i}. {section}")
+    with TerraformDocExtractor() as extractor:
+        try:
+            sections = extractor.list_available_sections(url)
             
-    except Exception as e:
-        logger.bind(error=str(e)).error("Failed to list sections")
-        sys.exit(1)
+            if not sections:
+                click.echo("No sections found", err=True)
+                sys.exit(1)
+            
+            click.echo("Available sections:")
+            for i, section in enumerate(sections, 1):
+                click.echo(f"  {i}. {section}")
+                
+        except Exception as e:
+            logger.bind(error=str(e)).error("Failed to list sections")
+            sys.exit(1)
 
 
 @cli.command()
@@ -146,25 +229,65 @@ def extract_all(ctx, url, text, output):
     
         $ terraform-doc-extract extract-all "hashicorp/aws/5.100.0/docs/resources/lb"
     """
-    extractor = TerraformDocExtractor()
+    with TerraformDocExtractor() as extractor:
+        try:
+            result = extractor.extract_full_documentation(url, as_text=text)
+            
+            if not result:
+                click.echo("Failed to extract documentation", err=True)
+                sys.exit(1)
+            
+            write_output([result], output)
+                
+        except Exception as e:
+            logger.bind(error=str(e)).error("Failed to extract documentation")
+            sys.exit(1)
+
+
+@cli.command()
+@click.argument('urls', nargs=-1)
+@click.option('--urls-file', '-f', type=click.File('r'), help='File with one URL per line')
+@click.option('--sections', '-s', multiple=True, help='Section names to extract (default: full documentation)')
+@click.option('--text', is_flag=True, help='Output as plain text instead of HTML')
+@click.option('--concurrency', '-c', type=click.IntRange(min=1), default=DEFAULT_BATCH_CONCURRENCY, show_default=True, help='Maximum number of pages fetched at once')
+@click.option('--output', '-o', type=click.Path(), help='Output file (default: stdout)')
+@click.pass_context
+def batch(ctx, urls, urls_file, sections, text, concurrency, output):
+    """
+    Extract documentation from many pages in one run.
+    
+    Pages are fetched concurrently with one shared browser, and results are
+    written as newline-delimited JSON, one object per URL.
+    
+    Examples:
     
-    try:
-        result = extractor.extract_full_documentation(url, as_text=text)
+        Extract the full documentation of two resources:
         
-        if not result:
-            click.echo("Failed to extract documentation", err=True)
-            sys.exit(1)
+        $ terraform-doc-extract batch "hashicorp/aws/5.100.0/docs/resources/lb" "hashicorp/aws/5.100.0/docs/resources/s3_bucket"
         
-        if output:
-            with open(output, 'w') as f:
-                f.write(result)
-            logger.bind(output_file=output).info("Saved output to file")
-        else:
-            click.echo(result)
-            
-    except Exception as e:
-        logger.bind(error=str(e)).error("Failed to extract documentation")
+        Extract sections for every URL listed in a file:
+        
+        $ terraform-doc-extract batch -f urls.txt -s "Example Usage" --text
+    """
+    url_list = read_urls(urls, urls_file)
+    if not url_list:
+        click.echo("Error: Must specify URLs or --urls-file", err=True)
         sys.exit(1)
+    
+    with TerraformDocExtractor(max_concurrency=concurrency) as extractor:
+        try:
+            if sections:
+                results = extractor.extract_sections_many(url_list, list(sections), as_text=text)
+                chunks = iter_batch_output(results, 'sections')
+            else:
+                results = extractor.extract_full_documentation_many(url_list, as_text=text)
+                chunks = iter_batch_output(results, 'documentation')
+            
+            write_output(chunks, output)
+            
+        except Exception as e:
+            logger.bind(error=str(e)).error("Failed to extract batch")
+            sys.exit(1)
 
 
 def main():
@@ -2,13 +2,14 @@
 
 from .extractor import TerraformDocExtractor
 from .url_parser import TerraformURL
-from .fetcher import PageFetcher
+from .fetcher import PageFetcher, FetcherPool
 from .parser import DocumentationParser
 
 __all__ = [
     "TerraformDocExtractor",
     "TerraformURL",
     "PageFetcher",
+    "FetcherPool",
     "DocumentationParser"
 ]
 
@@ -0,0 +1,260 @@
+"""Caches for fetched documentation pages."""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+from loguru import logger
+
+
+# zlib level for compressed in-memory pages; HTML shrinks well even at the fastest level
+MEMORY_COMPRESSION_LEVEL = 1
+
+
+class BoundedHTMLCache:
+    """
+    Least-recently-used cache mapping URLs to fetched HTML.
+    
+    Once the cache holds ``max_entries`` pages, or its pages add up to more
+    than ``max_bytes`` characters, storing another one evicts the pages that
+    were used least recently. A page larger than ``max_bytes`` on its own is
+    still kept, as the only entry. With ``max_entries=0`` nothing is stored.
+    
+    With ``compress=True`` pages are held zlib-compressed and decompressed on
+    each hit, trading a little CPU for several times more pages per MB.
+    
+    The cache is safe to use from several threads.
+    
+    Example:
+        >>> cache = BoundedHTMLCache(max_entries=2)
+        >>> cache.put("https://example.com/a", "<html>a</html>")
+        >>> cache.get("https://example.com/a")
+        '<html>a</html>'
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = None,
+        compress: bool = False
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of pages to keep (0 disables the cache)
+            max_bytes: Maximum total size of the kept pages (default: unbounded),
+                in characters, or in compressed bytes if ``compress`` is set
+            compress: Keep pages zlib-compressed in memory
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self._entries: "OrderedDict[str, Union[str, bytes]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._entries
+    
+    def get(self, url: str) -> Optional[str]:
+        """
+        Get cached HTML for a URL, marking it as recently used.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            Cached HTML, or None if the URL is not cached
+        """
+        with self._lock:
+            value = self._entries.get(url)
+            if value is None:
+                return None
+            self._entries.move_to_end(url)
+        return self._decode(value)
+    
+    def put(self, url: str, html: str):
+        """
+        Store HTML for a URL, evicting the least recently used pages if full.
+        
+        Args:
+            url: Page URL
+            html: HTML content
+        """
+        if self.max_entries <= 0:
+            return
+        
+        value = zlib.compress(html.encode('utf-8'), MEMORY_COMPRESSION_LEVEL) if self.compress else html
+        with self._lock:
+            self._total_bytes += len(value) - len(self._entries.get(url, ''))
+            self._entries[url] = value
+            self._entries.move_to_end(url)
+            
+            while len(self._entries) > self.max_entries:
+                self._evict()
+            
+            if self.max_bytes is not None:
+                while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                    self._evict()
+    
+    def _evict(self):
+        """Drop the least recently used page; the caller holds the lock."""
+        _, value = self._entries.popitem(last=False)
+        self._total_bytes -= len(value)
+    
+    def pop(self, url: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Remove a URL from the cache.
+        
+        Args:
+            url: Page URL
+            default: Value returned if the URL is not cached
+        
+        Returns:
+            The removed HTML, or ``default``
+        """
+        with self._lock:
+            value = self._entries.pop(url, None)
+            if value is None:
+                return default
+            self._total_bytes -= len(value)
+        return self._decode(value)
+    
+    @staticmethod
+    def _decode(value: Union[str, bytes]) -> str:
+        """Turn a stored value back into HTML."""
+        if isinstance(value, bytes):
+            return zlib.decompress(value).decode('utf-8')
+        return value
+    
+    def clear(self):
+        """Remove all cached pages."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+class DiskHTMLCache:
+    """
+    Gzip-compressed HTML pages stored as files in a cache directory.
+    
+    Entries never expire. Pages whose content can change should be stored
+    with their HTTP validators (``etag`` and ``last_modified``), so callers
+    can revalidate them with a conditional request before reuse.
+    
+    Example:
+        >>> cache = DiskHTMLCache("/tmp/tf-docs")
+        >>> cache.put("hashicorp/aws/5.100.0/lb", "<html>lb</html>")
+        >>> cache.get("hashicorp/aws/5.100.0/lb")
+        '<html>lb</html>'
+    """
+    
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Cache directory. Defaults to ``default_cache_dir()``.
+        """
+        self.directory = Path(directory) if directory else default_cache_dir()
+    
+    def _path(self, key: str, suffix: str = ".html.gz") -> Path:
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.directory / f"{digest}{suffix}"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Read a cached page.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached HTML, or None if the page is not cached or unreadable
+        """
+        try:
+            with gzip.open(self._path(key), 'rt', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, UnicodeDecodeError) as e:
+            logger.bind(key=key, error=str(e)).warning("Ignoring unreadable cache entry")
+            return None
+    
+    def get_validators(self, key: str) -> Dict[str, str]:
+        """
+        Read the HTTP validators stored with a page.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Dict with ``etag`` and/or ``last_modified``, empty if none were stored
+        """
+        try:
+            with open(self._path(key, ".json"), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.bind(key=key, error=str(e)).warning("Ignoring unreadable cache validators")
+            return {}
+    
+    def put(self, key: str, html: str, validators: Optional[Dict[str, str]] = None):
+        """
+        Store a page, replacing any existing entry atomically.
+        
+        Args:
+            key: Cache key
+            html: HTML content
+            validators: HTTP validators (``etag``, ``last_modified``) for the page
+        """
+        path = self._path(key)
+        validators_path = self._path(key, ".json")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{_tmp_suffix()}")
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                f.write(html)
+            os.replace(tmp_path, path)
+            
+            if validators:
+                tmp_path = validators_path.with_name(f"{validators_path.name}.{_tmp_suffix()}")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(validators, f)
+                os.replace(tmp_path, validators_path)
+            elif validators_path.exists():
+                validators_path.unlink()
+        except OSError as e:
+            logger.bind(key=key, error=str(e)).warning("Failed to write cache entry")
+    
+    def clear(self):
+        """Remove all cached pages."""
+        for pattern in ("*.html.gz", "*.json"):
+            for path in self.directory.glob(pattern):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+def _tmp_suffix() -> str:
+    """Temporary file suffix unique to the calling process and thread."""
+    return f"{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache directory, honouring ``XDG_CACHE_HOME``."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "terraform-doc-extractor"
@@ -1,6 +1,7 @@
 """Main extractor class combining URL parsing, fetching, and parsing."""
 
 from typing import List, Dict, Optional
+import requests
 from loguru import logger
 
 from .url_parser import TerraformURL
@@ -12,19 +13,25 @@ class TerraformDocExtractor:
     """
     Main class for extracting documentation sections from Terraform Registry.
     
+    The underlying browser is reused across calls. Use the extractor as a
+    context manager (or call ``close()``) to shut it down when done.
+    
     Example:
-        >>> extractor = TerraformDocExtractor()
-        >>> sections = extractor.extract_sections(
-        ...     "https://registry.terraform.io/providers/hashicorp/aws/5.100.0/docs/resources/lb",
-        ...     ["Example Usage", "Argument Reference"]
-        ... )
+        >>> with TerraformDocExtractor() as extractor:
+        ...     sections = extractor.extract_sections(
+        ...         "https://registry.terraform.io/providers/hashicorp/aws/5.100.0/docs/resources/lb",
+        ...         ["Example Usage", "Argument Reference"]
+        ...     )
     """
     
     def __init__(
         self,
         headless: bool = True,
         timeout: int = 10,
-        wait_time: int = 2
+        wait_time: int = 2,
+        max_concurrency: int = 20,
+        cache_dir: Optional[str] = None,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize the extractor.
@@ -32,14 +39,55 @@ class TerraformDocExtractor:
         Args:
             headless: Run browser in headless mode
             timeout: Maximum time to wait for page elements
-            wait_time: Extra wait time after page load
+            wait_time: Maximum extra wait for the documentation to render
+            max_concurrency: Maximum number of pages fetched at once by batch methods
+            cache_dir: Directory for persisted pages (default: per-user cache dir)
+            http_session: Shared session for plain HTTP requests (see PageFetcher)
         """
         self.fetcher = PageFetcher(
             headless=headless,
             timeout=timeout,
-            wait_time=wait_time
+            wait_time=wait_time,
+            max_concurrency=max_concurrency,
+            disk_cache_dir=cache_dir,
+            http_session=http_session
         )
     
+    def __enter__(self) -> "TerraformDocExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the browser used for fetching."""
+        self.fetcher.close()
+    
+    def fetch_html(self, url: str) -> Optional[str]:
+        """
+        Fetch the raw HTML of a documentation page.
+        
+        Pages are cached by the fetcher, so fetching the same page again is
+        cheap. Use this to fetch once and parse the HTML yourself.
+        
+        Args:
+            url: Terraform Registry URL or path
+            
+        Returns:
+            HTML content as string, or None if the URL is invalid or the fetch failed
+        """
+        tf_url = TerraformURL.parse(url)
+        if not tf_url:
+            logger.bind(url=url).error("Failed to parse URL")
+            return None
+        
+        html = self.fetcher.fetch(tf_url.url)
+        if not html:
+            logger.bind(url=tf_url.url).error("Failed to fetch page")
+            return None
+        
+        return html
+    
     def extract_sections(
         self,
         url: str,
@@ -64,26 +112,145 @@ class TerraformDocExtractor:
             ...     ["Example Usage"]
             ... )
         """
-        tf_url = TerraformURL.parse(url)
-        if not tf_url:
-            logger.bind(url=url).error("Failed to parse URL")
-            return {}
-        
-        html = self.fetcher.fetch(tf_url.url)
+        html = self.fetch_html(url)
         if not html:
-            logger.bind(url=tf_url.url).error("Failed to fetch page")
             return {}
         
-        parser = DocumentationParser(html)
+        return self._select_sections(DocumentationParser(html), sections, as_text)
+    
+    def extract_sections_many(
+        self,
+        urls: List[str],
+        sections: Optional[List[str]] = None,
+        as_text: bool = False
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Extract the same sections from multiple documentation pages.
+        
+        All pages are fetched concurrently, so a batch takes roughly as long
+        as its slowest page instead of the sum of all pages.
+        This call blocks, so it cannot be used inside a running event loop;
+        await ``fetcher.fetch_many()`` there and parse the pages instead.
+        
+        Args:
+            urls: Terraform Registry URLs or paths
+            sections: List of section names to extract. If None, extracts all sections.
+            as_text: If True, return plain text instead of HTML
+            
+        Returns:
+            Dict mapping each input URL to its extracted sections
+            (an empty dict if the URL was invalid or could not be fetched)
+            
+        Raises:
+            RuntimeError: If called while an event loop is running in this thread
+            
+        Example:
+            >>> extractor = TerraformDocExtractor()
+            >>> results = extractor.extract_sections_many(
+            ...     [
+            ...         "hashicorp/aws/5.100.0/docs/resources/lb",
+            ...         "hashicorp/aws/5.100.0/docs/resources/s3_bucket"
+            ...     ],
+            ...     ["Example Usage"]
+            ... )
+        """
+        results: Dict[str, Dict[str, Optional[str]]] = {}
+        for url, html in self._fetch_many(urls).items():
+            if html:
+                results[url] = self._select_sections(DocumentationParser(html), sections, as_text)
+            else:
+                results[url] = {}
+        
+        return results
+    
+    def extract_full_documentation_many(
+        self,
+        urls: List[str],
+        as_text: bool = False
+    ) -> Dict[str, Optional[str]]:
+        """
+        Extract the complete documentation from multiple pages.
+        
+        All pages are fetched concurrently, like ``extract_sections_many``.
         
+        Args:
+            urls: Terraform Registry URLs or paths
+            as_text: If True, return plain text instead of HTML
+            
+        Returns:
+            Dict mapping each input URL to its documentation
+            (None if the URL was invalid or could not be fetched)
+            
+        Raises:
+            RuntimeError: If called while an event loop is running in this thread
+        """
+        results: Dict[str, Optional[str]] = {}
+        for url, html in self._fetch_many(urls).items():
+            if html:
+                results[url] = self._full_documentation(DocumentationParser(html), as_text)
+            else:
+                results[url] = None
+        
+        return results
+    
+    def _fetch_many(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetch the pages for several URLs concurrently.
+        
+        Args:
+            urls: Terraform Registry URLs or paths
+            
+        Returns:
+            Dict mapping each input URL to its HTML (None if invalid or not fetched)
+        """
+        results: Dict[str, Optional[str]] = {url: None for url in urls}
+        
+        tf_urls = {}
+        for url in urls:
+            tf_url = TerraformURL.parse(url)
+            if not tf_url:
+                logger.bind(url=url).error("Failed to parse URL")
+                continue
+            tf_urls[url] = tf_url
+        
+        pages = self.fetcher.fetch_many_sync([tf_url.url for tf_url in tf_urls.values()])
+        
+        for (url, tf_url), html in zip(tf_urls.items(), pages):
+            if not html:
+                logger.bind(url=tf_url.url).error("Failed to fetch page")
+                continue
+            results[url] = html
+        
+        return results
+    
+    def _select_sections(
+        self,
+        parser: DocumentationParser,
+        sections: Optional[List[str]],
+        as_text: bool
+    ) -> Dict[str, Optional[str]]:
+        """
+        Pick the requested sections out of a parsed page.
+        
+        Args:
+            parser: Parser for the fetched page
+            sections: List of section names to extract. If None, extracts all sections.
+            as_text: If True, return plain text instead of HTML
+            
+        Returns:
+            Dict mapping section names to their content
+        """
         if sections is None:
             if as_text:
                 return {
                     name: parser.get_section_text(name)
-                    for name in parser.list_sections()
+                    for name in parser.iter_section_names()
                 }
             return parser.get_all_sections()
         
+        if len(sections) > 1:
+            return parser.get_sections_batch(sections, as_text=as_text)
+        
         if as_text:
             return {
                 name: parser.get_section_text(name)
@@ -110,14 +277,8 @@ class TerraformDocExtractor:
             >>> print(sections)
             ['Example Usage', 'Argument Reference', 'Attribute Reference', ...]
         """
-        tf_url = TerraformURL.parse(url)
-        if not tf_url:
-            logger.bind(url=url).error("Failed to parse URL")
-            return []
-        
-        html = self.fetcher.fetch(tf_url.url)
+        html = self.fetch_html(url)
         if not html:
-            logger.bind(url=tf_url.url).error("Failed to fetch page")
             return []
         
         parser = DocumentationParser(html)
@@ -138,24 +299,29 @@ class TerraformDocExtractor:
         Returns:
             Full documentation content as string
         """
-        tf_url = TerraformURL.parse(url)
-        if not tf_url:
-            logger.bind(url=url).error("Failed to parse URL")
-            return None
-        
-        html = self.fetcher.fetch(tf_url.url)
+        html = self.fetch_html(url)
         if not html:
-            logger.bind(url=tf_url.url).error("Failed to fetch page")
             return None
         
-        parser = DocumentationParser(html)
+        return self._full_documentation(DocumentationParser(html), as_text)
+    
+    def _full_documentation(
+        self,
+        parser: DocumentationParser,
+        as_text: bool
+    ) -> Optional[str]:
+        """
+        Get the complete documentation of a parsed page.
         
+        Args:
+            parser: Parser for the fetched page
+            as_text: If True, return plain text instead of HTML
+            
+        Returns:
+            Full documentation content as string
+        """
         if as_text:
-            doc_html = parser.get_full_documentation()
-            if doc_html:
-                soup_doc = parser.soup.find('div', {'id': 'provider-doc'})
-                if soup_doc:
-                    return soup_doc.get_text(separator='\n', strip=True)
+            return parser.get_full_documentation_text()
         
         return parser.get_full_documentation()
 
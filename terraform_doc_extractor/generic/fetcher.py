@@ -1,7 +1,12 @@
 """HTML fetcher for Terraform Registry pages."""
 
-import time
-from typing import Optional
+import asyncio
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+import aiohttp
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -10,17 +15,97 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
 from loguru import logger
 
+from .cache import BoundedHTMLCache, DiskHTMLCache
+from .parser import PROVIDER_DOC_MARKER
+from .url_parser import TerraformURL
+
+
+# Days a downloaded chromedriver is reused before checking for a newer one
+DRIVER_CACHE_VALID_DAYS = 7
+
+# Chrome switches that cut page load work irrelevant to the documentation DOM
+CHROME_SPEED_ARGUMENTS = (
+    '--blink-settings=imagesEnabled=false',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--metrics-recording-only',
+    '--mute-audio',
+)
+
+# True once the documentation div has been populated by the page's JavaScript
+DOCUMENTATION_RENDERED_SCRIPT = (
+    "const e = document.querySelector('#provider-doc');"
+    " return e !== null && e.children.length > 0;"
+)
+
+# Registry pages are UTF-8; used when a response declares no charset, instead of guessing
+DEFAULT_PAGE_ENCODING = 'utf-8'
+
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+
+def _response_text(response: requests.Response) -> str:
+    """Decode a response body with its declared charset, or UTF-8 if it has none."""
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        # requests would otherwise fall back to ISO-8859-1 for text/html
+        response.encoding = DEFAULT_PAGE_ENCODING
+    return response.text
+
+
+async def _response_text_async(response: aiohttp.ClientResponse) -> str:
+    """Asynchronous counterpart of ``_response_text``."""
+    return await response.text(encoding=response.charset or DEFAULT_PAGE_ENCODING, errors='replace')
+
 
 class PageFetcher:
-    """Fetches JavaScript-rendered pages using Selenium."""
+    """
+    Fetches Terraform Registry pages.
+    
+    Pages are first requested over plain HTTP and only rendered with
+    Selenium if their documentation is available after JavaScript runs.
+    Batches are requested concurrently over one connection pool.
+    
+    The Chrome WebDriver is started on the first Selenium fetch and reused
+    for every following one. Call ``close()`` (or use the fetcher as a
+    context manager) to shut the browser down.
+    
+    Successfully fetched pages are kept in an in-memory LRU cache keyed by
+    URL, so fetching the same page again does not hit the network. Pages of
+    pinned provider versions (anything but ``latest``) never change, so they
+    are also stored on disk and reused by later processes. ``latest`` pages
+    served with an ETag or Last-Modified header are stored on disk too, and
+    reused once a conditional request confirms they have not changed.
+    
+    Example:
+        >>> with PageFetcher() as fetcher:
+        ...     first = fetcher.fetch(url1)
+        ...     second = fetcher.fetch(url2)  # Same browser, no restart
+    """
+    
+    # Resolved chromedriver path, shared by all fetchers in the process
+    _driver_path: Optional[str] = None
+    _driver_path_lock = threading.Lock()
     
     def __init__(
         self,
         headless: bool = True,
         timeout: int = 10,
-        wait_time: int = 2
+        wait_time: int = 2,
+        max_concurrency: int = 20,
+        cache_size: int = 128,
+        disk_cache: bool = True,
+        disk_cache_dir: Optional[str] = None,
+        static_first: bool = True,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize the page fetcher.
@@ -28,18 +113,216 @@ class PageFetcher:
         Args:
             headless: Run browser in headless mode
             timeout: Maximum time to wait for page elements
-            wait_time: Extra wait time after page load
+            wait_time: Maximum extra wait for the documentation to render
+            max_concurrency: Maximum number of concurrent HTTP requests in batch fetches
+            cache_size: Maximum number of fetched pages to keep in memory
+            disk_cache: Persist fetched pages across runs
+            disk_cache_dir: Directory for the disk cache (default: per-user cache dir)
+            static_first: Try a plain HTTP request before rendering a page with Selenium
+            http_session: Session for plain HTTP requests, shared with other fetchers to
+                reuse its connections. It is left open by ``close()``. Defaults to a
+                session of the fetcher's own.
         """
         self.headless = headless
         self.timeout = timeout
         self.wait_time = wait_time
+        self.max_concurrency = max_concurrency
+        self.static_first = static_first
+        self._driver: Optional[webdriver.Chrome] = None
+        self._http: Optional[requests.Session] = http_session
+        self._owns_http = http_session is None
+        self._cache = BoundedHTMLCache(max_entries=cache_size)
+        self._disk_cache = DiskHTMLCache(disk_cache_dir) if disk_cache else None
+    
+    def __enter__(self) -> "PageFetcher":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Quit the shared WebDriver and HTTP session, if they were started."""
+        if self._http is not None and self._owns_http:
+            self._http.close()
+            self._http = None
+        
+        if self._driver is None:
+            return
+        
+        try:
+            self._driver.quit()
+        except WebDriverException as e:
+            logger.bind(error=str(e)).warning("Failed to quit WebDriver cleanly")
+        finally:
+            self._driver = None
+            logger.debug("Closed WebDriver")
+    
+    def clear_cache(self, disk: bool = False):
+        """
+        Forget fetched pages so the next fetch hits the network.
+        
+        Args:
+            disk: Also delete pages persisted in the disk cache
+        """
+        cache_size = len(self._cache)
+        self._cache.clear()
+        if disk and self._disk_cache is not None:
+            self._disk_cache.clear()
+        logger.bind(cleared_entries=cache_size, disk=disk).debug("Cleared fetcher cache")
+    
+    @staticmethod
+    def _disk_cache_key(url: str) -> Tuple[Optional[str], bool]:
+        """
+        Disk cache key for a URL, and whether its content may change.
+        
+        Returns:
+            Tuple of the key (None for non-registry URLs) and True for ``latest`` pages
+        """
+        tf_url = TerraformURL.parse(url)
+        if tf_url is None:
+            return None, False
+        key = f"{tf_url.namespace}/{tf_url.provider}/{tf_url.version}/{tf_url.resource}"
+        return key, tf_url.version == 'latest'
+    
+    @staticmethod
+    def _validators(headers: Mapping[str, str]) -> Dict[str, str]:
+        """HTTP validators of a response, for later conditional requests."""
+        validators = {}
+        if headers.get('ETag'):
+            validators['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            validators['last_modified'] = headers['Last-Modified']
+        return validators
+    
+    def _conditional_headers(self, url: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """
+        Request headers revalidating a ``latest`` page stored on disk.
+        
+        Returns:
+            Tuple of the disk cache key and the headers; headers are empty
+            if the page has no stored validators
+        """
+        if self._disk_cache is None:
+            return None, {}
+        
+        key, mutable = self._disk_cache_key(url)
+        if key is None or not mutable:
+            return None, {}
+        
+        validators = self._disk_cache.get_validators(key)
+        headers = {}
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+        return key, headers
+    
+    def _static_result(
+        self,
+        url: str,
+        key: Optional[str],
+        status: int,
+        html: Optional[str],
+        headers: Mapping[str, str]
+    ) -> Optional[str]:
+        """
+        Handle the response to a plain HTTP request for a page.
+        
+        Returns:
+            The disk cached page on 304, the new page on 200 if it contains
+            the documentation, otherwise None
+        """
+        if status == 304 and key is not None:
+            html = self._disk_cache.get(key)
+            if html is not None:
+                logger.bind(url=url).debug("Disk cached page not modified")
+                self._cache.put(url, html)
+            return html
+        
+        if status == 200 and html and PROVIDER_DOC_MARKER in html:
+            logger.bind(url=url, html_length=len(html)).debug("Page fetched over HTTP")
+            self._store(url, html, self._validators(headers))
+            return html
+        
+        logger.bind(url=url, status=status).debug("Documentation not in static HTML")
+        return None
+    
+    def _fetch_static(self, url: str) -> Optional[str]:
+        """
+        Request a page over plain HTTP, revalidating a disk cached copy if there is one.
+        
+        Returns:
+            HTML content if the static page contains the documentation, otherwise None
+        """
+        key, headers = self._conditional_headers(url)
+        if self._http is None:
+            self._http = requests.Session()
+        
+        try:
+            response = self._http.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.bind(url=url, error=str(e)).warning("HTTP request failed")
+            return None
+        
+        html = _response_text(response) if response.status_code == 200 else None
+        return self._static_result(url, key, response.status_code, html, response.headers)
+    
+    async def _fetch_static_async(
+        self,
+        url: str,
+        session: aiohttp.ClientSession
+    ) -> Optional[str]:
+        """Asynchronous counterpart of ``_fetch_static``, using a shared session."""
+        key, headers = self._conditional_headers(url)
+        
+        try:
+            async with session.get(url, headers=headers) as response:
+                html = await _response_text_async(response) if response.status == 200 else None
+                return self._static_result(url, key, response.status, html, response.headers)
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            logger.bind(url=url, error=str(e)).warning("HTTP request failed")
+            return None
+    
+    def _get_cached(self, url: str) -> Optional[str]:
+        """Look a page up in memory, then on disk if it cannot have changed."""
+        html = self._cache.get(url)
+        if html is not None or self._disk_cache is None:
+            return html
+        
+        key, mutable = self._disk_cache_key(url)
+        if key is None or mutable:
+            return None
+        
+        html = self._disk_cache.get(key)
+        if html is not None:
+            logger.bind(url=url).debug("Loaded page from disk cache")
+            self._cache.put(url, html)
+        return html
+    
+    def _store(self, url: str, html: str, validators: Optional[Dict[str, str]] = None):
+        """
+        Cache a fetched page in memory and, if it can be reused safely, on disk.
+        
+        Args:
+            url: Page URL
+            html: HTML content
+            validators: HTTP validators of the response, needed to persist ``latest`` pages
+        """
+        self._cache.put(url, html)
+        # Error pages are not worth keeping forever
+        if self._disk_cache is None or PROVIDER_DOC_MARKER not in html:
+            return
+        
+        key, mutable = self._disk_cache_key(url)
+        if key is not None and (validators or not mutable):
+            self._disk_cache.put(key, html, validators)
         
     def _create_driver(self) -> webdriver.Chrome:
         """Create a configured Chrome WebDriver instance."""
         chrome_options = Options()
         
         if self.headless:
-            chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--headless=new')
         
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -48,14 +331,71 @@ class PageFetcher:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
-        service = Service(ChromeDriverManager().install())
+        # Only the rendered DOM is needed, so skip images and background work
+        for argument in CHROME_SPEED_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_experimental_option("prefs", CHROME_PREFS)
+        
+        # Return from driver.get() at DOMContentLoaded; fetch() waits for the article itself
+        chrome_options.page_load_strategy = 'eager'
+        
+        service = Service(self._resolve_driver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
         
         return driver
     
+    @classmethod
+    def _resolve_driver_path(cls) -> str:
+        """Install or locate chromedriver, at most once per process."""
+        with cls._driver_path_lock:
+            if cls._driver_path is None:
+                cache_manager = DriverCacheManager(valid_range=DRIVER_CACHE_VALID_DAYS)
+                cls._driver_path = ChromeDriverManager(cache_manager=cache_manager).install()
+                logger.bind(driver_path=cls._driver_path).debug("Resolved chromedriver")
+        return cls._driver_path
+    
+    def _get_driver(self) -> webdriver.Chrome:
+        """Return the shared WebDriver, starting it on first use."""
+        if self._driver is None:
+            logger.debug("Starting WebDriver")
+            self._driver = self._create_driver()
+        return self._driver
+    
+    def _reset_session(self):
+        """Clear browser state between fetches, dropping the driver if it broke."""
+        if self._driver is None:
+            return
+        
+        try:
+            self._driver.delete_all_cookies()
+        except WebDriverException:
+            self.close()
+    
     def fetch(self, url: str) -> Optional[str]:
         """
-        Fetch a JavaScript-rendered page.
+        Fetch a page, rendering its JavaScript if the documentation needs it.
+        
+        Args:
+            url: URL to fetch
+            
+        Returns:
+            HTML content as string, or None if fetch failed
+        """
+        cached = self._get_cached(url)
+        if cached is not None:
+            logger.bind(url=url).debug("Using cached page")
+            return cached
+        
+        if self.static_first:
+            html = self._fetch_static(url)
+            if html is not None:
+                return html
+        
+        return self._render(url)
+    
+    def _render(self, url: str) -> Optional[str]:
+        """
+        Load a page in the shared browser and return the rendered HTML.
         
         Args:
             url: URL to fetch
@@ -64,21 +404,29 @@ class PageFetcher:
             HTML content as string, or None if fetch failed
         """
         logger.bind(url=url).info("Fetching page")
-        driver = None
         
         try:
-            driver = self._create_driver()
+            driver = self._get_driver()
             driver.get(url)
             
             WebDriverWait(driver, self.timeout).until(
                 EC.presence_of_element_located((By.TAG_NAME, "article"))
             )
             
-            time.sleep(self.wait_time)
+            # Return as soon as the documentation is rendered, at most wait_time later
+            try:
+                WebDriverWait(driver, self.wait_time).until(
+                    lambda d: d.execute_script(DOCUMENTATION_RENDERED_SCRIPT)
+                )
+            except TimeoutException:
+                logger.bind(url=url, wait_time=self.wait_time).debug(
+                    "Documentation not fully rendered, using page as is"
+                )
             
             html = driver.page_source
             logger.bind(html_length=len(html)).debug("Page fetched successfully")
             
+            self._store(url, html)
             return html
             
         except TimeoutException:
@@ -87,6 +435,8 @@ class PageFetcher:
             
         except WebDriverException as e:
             logger.bind(url=url, error=str(e)).error("WebDriver error occurred")
+            # The browser may have crashed; start a fresh one on the next fetch
+            self.close()
             return None
             
         except Exception as e:
@@ -94,6 +444,230 @@ class PageFetcher:
             return None
             
         finally:
-            if driver:
-                driver.quit()
+            self._reset_session()
+    
+    async def fetch_async(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[str]:
+        """
+        Fetch a page over plain HTTP without rendering JavaScript.
+        
+        Args:
+            url: URL to fetch
+            session: Optional shared client session. If omitted, a temporary one is created.
+            
+        Returns:
+            HTML content as string, or None if fetch failed
+        """
+        if session is None:
+            async with self._create_session() as own_session:
+                return await self.fetch_async(url, own_session)
+        
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    logger.bind(url=url, status=response.status).warning("Unexpected HTTP status")
+                    return None
+                
+                html = await _response_text_async(response)
+                logger.bind(url=url, html_length=len(html)).debug("Page fetched over HTTP")
+                return html
+                
+        except asyncio.TimeoutError:
+            logger.bind(url=url, timeout=self.timeout).error("Timeout waiting for HTTP response")
+            return None
+            
+        except aiohttp.ClientError as e:
+            logger.bind(url=url, error=str(e)).error("HTTP error occurred")
+            return None
+    
+    async def fetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Fetch multiple pages concurrently.
+        
+        Pages are requested over HTTP through one shared connection pool.
+        Any page whose HTML lacks the rendered documentation is fetched again
+        with Selenium, one at a time.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            List of HTML strings (or None for failed fetches), in the order of ``urls``
+            
+        Example:
+            >>> fetcher = PageFetcher()
+            >>> pages = asyncio.run(fetcher.fetch_many([url1, url2]))
+        """
+        logger.bind(count=len(urls)).info("Fetching pages concurrently")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        browser_lock = asyncio.Lock()
+        
+        async with self._create_session() as session:
+            results = await asyncio.gather(
+                *[
+                    self._fetch_with_fallback(url, session, semaphore, browser_lock)
+                    for url in urls
+                ],
+                return_exceptions=True
+            )
+        
+        pages = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.bind(url=url, error=str(result)).error("Unexpected error during fetch")
+                pages.append(None)
+            else:
+                pages.append(result)
+        
+        return pages
+    
+    def fetch_many_sync(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Blocking form of ``fetch_many``, for callers that are not async.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            List of HTML strings (or None for failed fetches), in the order of ``urls``
+            
+        Raises:
+            RuntimeError: If an event loop is already running in this thread
+                (e.g. in Jupyter or an async application). Await ``fetch_many`` there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_many(urls))
+        raise RuntimeError(
+            "Batch fetches cannot block inside a running event loop; "
+            "await PageFetcher.fetch_many() instead"
+        )
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP client session with a bounded connection pool."""
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+    
+    async def _fetch_with_fallback(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        browser_lock: asyncio.Lock
+    ) -> Optional[str]:
+        """
+        Fetch a page over HTTP, rendering it with Selenium if needed.
+        
+        Args:
+            url: URL to fetch
+            session: Shared client session
+            semaphore: Limits concurrent HTTP requests
+            browser_lock: Serializes Selenium fallbacks
+            
+        Returns:
+            HTML content as string, or None if fetch failed
+        """
+        cached = self._get_cached(url)
+        if cached is not None:
+            return cached
+        
+        async with semaphore:
+            html = await self._fetch_static_async(url, session)
+        if html is not None:
+            return html
+        
+        logger.bind(url=url).debug("Falling back to Selenium")
+        async with browser_lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._render, url)
+
 
+class FetcherPool:
+    """
+    Fixed set of PageFetchers handed out to one caller at a time.
+    
+    Each fetcher keeps its browser running between fetches, so threads that
+    borrow fetchers from the pool never pay for browser startup twice. All
+    fetchers share one HTTP session, so plain HTTP requests reuse the same
+    keep-alive connections. Call ``close()`` (or use the pool as a context manager) to shut all
+    browsers down.
+    
+    Example:
+        >>> with FetcherPool(size=4) as pool:
+        ...     with pool.fetcher() as fetcher:
+        ...         html = fetcher.fetch(url)
+    """
+    
+    def __init__(self, size: int = 1, **fetcher_options):
+        """
+        Initialize the pool.
+        
+        Args:
+            size: Number of fetchers (and browsers) in the pool
+            **fetcher_options: Arguments passed to each PageFetcher
+        """
+        self._http: Optional[requests.Session] = None
+        if fetcher_options.get("http_session") is None:
+            self._http = requests.Session()
+            # Room for one connection per fetcher, so none are thrown away when all are busy
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=max(size, requests.adapters.DEFAULT_POOLSIZE)
+            )
+            self._http.mount("https://", adapter)
+            fetcher_options["http_session"] = self._http
+        
+        self.fetchers = [PageFetcher(**fetcher_options) for _ in range(size)]
+        # Last in, first out: the fetcher released last most likely has a browser running
+        self._idle: "queue.LifoQueue[PageFetcher]" = queue.LifoQueue()
+        for fetcher in self.fetchers:
+            self._idle.put(fetcher)
+    
+    def __len__(self) -> int:
+        return len(self.fetchers)
+    
+    def __enter__(self) -> "FetcherPool":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def acquire(self) -> PageFetcher:
+        """Take an idle fetcher, waiting until one is released if all are in use."""
+        return self._idle.get()
+    
+    def release(self, fetcher: PageFetcher):
+        """Return a fetcher taken with ``acquire()``."""
+        self._idle.put(fetcher)
+    
+    @contextmanager
+    def fetcher(self) -> Iterator[PageFetcher]:
+        """Borrow a fetcher for the duration of a ``with`` block."""
+        fetcher = self.acquire()
+        try:
+            yield fetcher
+        finally:
+            self.release(fetcher)
+    
+    def clear_cache(self, disk: bool = False):
+        """
+        Forget fetched pages in every fetcher.
+        
+        Args:
+            disk: Also delete pages persisted in the disk cache
+        """
+        for fetcher in self.fetchers:
+            fetcher.clear_cache(disk=disk)
+    
+    def close(self):
+        """Quit every fetcher's browser and the shared HTTP session."""
+        for fetcher in self.fetchers:
+            fetcher.close()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
@@ -1,12 +1,263 @@
 """HTML parser for Terraform documentation sections."""
 
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup, Tag
+import bisect
+import copy
+import hashlib
+import re
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Iterator, List, Dict, Optional, Tuple
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement, soupparser
+from bs4 import BeautifulSoup
 from loguru import logger
 
 
+# Marker of the rendered documentation body in raw page HTML
+PROVIDER_DOC_MARKER = 'id="provider-doc"'
+
+# Error page title, and how far into the HTML to look for it
+PAGE_NOT_FOUND_TEXT = 'Page Not Found'
+PAGE_NOT_FOUND_SCAN_LENGTH = 16384
+
+# Number of parsed pages kept for reuse by parsers built from identical HTML,
+# and the most HTML (in characters) they may add up to; their trees are larger
+PARSED_DOCUMENT_CACHE_SIZE = 8
+PARSED_DOCUMENT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+_MULTI_NL = re.compile(r'\n{3,}')
+
+_find_provider_doc = etree.XPath("//div[@id='provider-doc']")
+
+# Tags whose text is not document text; BeautifulSoup's get_text skips the
+# same ones since 4.10 (requirements.txt needs >= 4.12), so output is unchanged
+_NON_TEXT_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+
+
+def _iter_strings(element: HtmlElement) -> Iterator[str]:
+    """
+    Yield the text pieces inside an element, in document order.
+    
+    Comments and the contents of script-like tags are skipped, and the
+    element's own tail is not included.
+    """
+    if element.tag in _NON_TEXT_TAGS:
+        return
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str):
+            yield from _iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _get_text(element: HtmlElement, separator: str = '', strip: bool = False) -> str:
+    """
+    Get the text of an element, like BeautifulSoup's ``Tag.get_text``.
+    
+    Args:
+        element: lxml element
+        separator: String inserted between text pieces
+        strip: Strip each text piece and drop empty ones
+        
+    Returns:
+        Text content of the element
+    """
+    strings = _iter_strings(element)
+    if strip:
+        strings = (text for text in (s.strip() for s in strings) if text)
+    return separator.join(strings)
+
+
+def _to_html(element: HtmlElement) -> str:
+    """Serialize an element (without its tail) to an HTML string."""
+    return lxml_html.tostring(element, encoding='unicode', with_tail=False)
+
+
+def _handle_heading(elem: HtmlElement) -> str:
+    text = _get_text(elem, strip=True)
+    return f"\n{'='*len(text)}\n{text}\n{'='*len(text)}\n"
+
+
+def _handle_paragraph(elem: HtmlElement) -> str:
+    text = _get_text(elem, strip=True)
+    return text + "\n" if text else ""
+
+
+def _handle_code(elem: HtmlElement) -> str:
+    return f"\n```\n{_get_text(elem)}\n```\n"
+
+
+def _handle_div(elem: HtmlElement) -> str:
+    code_elem = elem.find('.//pre')
+    if code_elem is None:
+        code_elem = elem.find('.//code')
+    if code_elem is not None:
+        return _handle_code(code_elem)
+    return _handle_default(elem)
+
+
+def _handle_list(elem: HtmlElement) -> str:
+    items = ''.join(
+        f"  • {_get_text(li, strip=True)}\n" for li in elem if li.tag == 'li'
+    )
+    return items + "\n"
+
+
+def _handle_blockquote(elem: HtmlElement) -> str:
+    text = _get_text(elem, strip=True)
+    return ''.join(f"> {line}\n" for line in text.split('\n')) + "\n"
+
+
+def _handle_default(elem: HtmlElement) -> str:
+    text = _get_text(elem, separator='\n', strip=True)
+    return text + "\n" if text else ""
+
+
+# Plain-text renderers for the top-level tags of a section
+_TEXT_HANDLERS = {
+    'h1': _handle_heading,
+    'h2': _handle_heading,
+    'h3': _handle_heading,
+    'h4': _handle_heading,
+    'h5': _handle_heading,
+    'h6': _handle_heading,
+    'p': _handle_paragraph,
+    'pre': _handle_code,
+    'code': _handle_code,
+    'div': _handle_div,
+    'ul': _handle_list,
+    'ol': _handle_list,
+    'blockquote': _handle_blockquote,
+}
+
+
+def _parse_tree(html: str) -> HtmlElement:
+    """
+    Parse page HTML into an lxml tree.
+    
+    libxml2 is used directly for speed. If it loses the documentation div on
+    markup it cannot handle, the page is re-parsed through BeautifulSoup's
+    more lenient html.parser backend.
+    
+    Args:
+        html: Raw HTML string
+        
+    Returns:
+        Root element of the page
+    """
+    try:
+        tree = lxml_html.document_fromstring(html)
+    except ValueError:
+        # Unicode strings carrying an XML encoding declaration
+        tree = lxml_html.document_fromstring(html.encode('utf-8'))
+    except etree.ParserError:
+        # Empty document
+        return lxml_html.Element('html')
+    
+    if not _find_provider_doc(tree) and PROVIDER_DOC_MARKER in html:
+        logger.debug("lxml lost the documentation div, falling back to BeautifulSoup")
+        tree = soupparser.fromstring(html)
+    
+    return tree
+
+
+# Placeholder for a documentation div that has not been looked up yet
+_NOT_SEARCHED = object()
+
+
+class _ParsedDocument:
+    """Parse results for one HTML page, shared by all parsers of that page."""
+    
+    __slots__ = (
+        "tree", "not_found", "provider_doc", "sections", "sections_lower",
+        "sorted_names", "section_html", "section_text"
+    )
+    
+    def __init__(self, html: str):
+        # Error pages carry no documentation, so don't bother parsing them
+        self.not_found = (
+            PAGE_NOT_FOUND_TEXT in html[:PAGE_NOT_FOUND_SCAN_LENGTH]
+            and PROVIDER_DOC_MARKER not in html
+        )
+        self.tree = lxml_html.Element('html') if self.not_found else _parse_tree(html)
+        # Documentation div (or None), looked up on first use
+        self.provider_doc = _NOT_SEARCHED
+        self.sections: Optional[Dict[str, HtmlElement]] = None
+        self.sections_lower: Optional[Dict[str, HtmlElement]] = None
+        self.sorted_names: Optional[List[Tuple[str, int, str]]] = None
+        # Rendered forms of section elements, filled in on first request
+        self.section_html: Dict[HtmlElement, str] = {}
+        self.section_text: Dict[HtmlElement, str] = {}
+
+
+# Keyed by a digest of the HTML, so the cache doesn't keep the page strings alive
+_parsed_documents: "OrderedDict[bytes, Tuple[int, _ParsedDocument]]" = OrderedDict()
+_parsed_documents_bytes = 0
+_parsed_documents_lock = threading.Lock()
+
+
+def _get_parsed_document(html: str) -> _ParsedDocument:
+    """
+    Get the parsed document for an HTML page, parsing it only on first use.
+    
+    Args:
+        html: Raw HTML string
+        
+    Returns:
+        Shared parse results for the page
+    """
+    global _parsed_documents_bytes
+    
+    key = hashlib.sha1(html.encode('utf-8', 'surrogatepass')).digest()
+    with _parsed_documents_lock:
+        entry = _parsed_documents.get(key)
+        if entry is not None:
+            _parsed_documents.move_to_end(key)
+    if entry is not None:
+        logger.debug("Reusing parsed document")
+        return entry[1]
+    
+    # Parse outside the lock so pages of different threads parse in parallel
+    document = _ParsedDocument(html)
+    if len(html) > PARSED_DOCUMENT_CACHE_MAX_BYTES:
+        return document
+    
+    with _parsed_documents_lock:
+        previous = _parsed_documents.pop(key, None)
+        if previous is not None:
+            _parsed_documents_bytes -= previous[0]
+        _parsed_documents[key] = (len(html), document)
+        _parsed_documents_bytes += len(html)
+        while (
+            len(_parsed_documents) > PARSED_DOCUMENT_CACHE_SIZE
+            or _parsed_documents_bytes > PARSED_DOCUMENT_CACHE_MAX_BYTES
+        ):
+            size, _ = _parsed_documents.popitem(last=False)[1]
+            _parsed_documents_bytes -= size
+    
+    return document
+
+
+def clear_parse_cache():
+    """Forget all parsed pages kept for reuse."""
+    global _parsed_documents_bytes
+    
+    with _parsed_documents_lock:
+        _parsed_documents.clear()
+        _parsed_documents_bytes = 0
+
+
 class DocumentationParser:
-    """Parses Terraform documentation HTML and extracts sections."""
+    """
+    Parses Terraform documentation HTML and extracts sections.
+    
+    Parsers built from identical HTML share one parse tree and section
+    index, so creating several parsers for the same page is cheap.
+    """
     
     def __init__(self, html: str):
         """
@@ -15,22 +266,90 @@ class DocumentationParser:
         Args:
             html: Raw HTML string
         """
-        self.soup = BeautifulSoup(html, 'lxml')
-        self._sections = None
+        self._document = _get_parsed_document(html)
+        self.tree = self._document.tree
+        self._html = html
+        self._soup: Optional[BeautifulSoup] = None
     
     @property
-    def sections(self) -> Dict[str, Tag]:
+    def soup(self) -> BeautifulSoup:
+        """
+        BeautifulSoup tree of the page (deprecated).
+        
+        Parsing now uses lxml directly, so the soup is built on first access
+        only. Use the lxml ``tree`` instead.
+        """
+        warnings.warn(
+            "DocumentationParser.soup is deprecated; use the lxml tree instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        if self._soup is None:
+            self._soup = BeautifulSoup(self._html, 'lxml')
+        return self._soup
+    
+    @property
+    def sections(self) -> Dict[str, HtmlElement]:
         """
         Get all available sections as a dictionary.
         
         Returns:
             Dict mapping section names to their content elements
         """
-        if self._sections is None:
-            self._sections = self._parse_sections()
-        return self._sections
+        if self._document.sections is None:
+            self._document.sections = self._parse_sections()
+        return self._document.sections
+    
+    @property
+    def _sections_lower(self) -> Dict[str, HtmlElement]:
+        """Sections keyed by lowercase name, for case-insensitive lookups."""
+        if self._document.sections_lower is None:
+            sections_lower: Dict[str, HtmlElement] = {}
+            for name, content in self.sections.items():
+                # Keep the first section when names differ only in case
+                sections_lower.setdefault(name.lower(), content)
+            self._document.sections_lower = sections_lower
+        return self._document.sections_lower
+    
+    def _names_with_prefix(self, prefix: str) -> List[str]:
+        """
+        Section names starting with a prefix (case-insensitive), in page order.
+        
+        Uses a sorted index of lowercase names, so each lookup is a binary
+        search instead of a scan over every section.
+        """
+        if self._document.sorted_names is None:
+            self._document.sorted_names = sorted(
+                (name.lower(), position, name)
+                for position, name in enumerate(self.sections)
+            )
+        sorted_names = self._document.sorted_names
+        
+        prefix_lower = prefix.lower()
+        matches = []
+        for index in range(bisect.bisect_left(sorted_names, (prefix_lower,)), len(sorted_names)):
+            lower, position, name = sorted_names[index]
+            if not lower.startswith(prefix_lower):
+                break
+            matches.append((position, name))
+        
+        return [name for _, name in sorted(matches)]
+    
+    def _section_html(self, content: HtmlElement) -> str:
+        """Serialize a section element to HTML, once per page."""
+        html = self._document.section_html.get(content)
+        if html is None:
+            html = self._document.section_html[content] = _to_html(content)
+        return html
     
-    def _parse_sections(self) -> Dict[str, Tag]:
+    def _section_text(self, content: HtmlElement) -> str:
+        """Render a section element as readable text, once per page."""
+        text = self._document.section_text.get(content)
+        if text is None:
+            text = self._document.section_text[content] = self._extract_readable_text(content)
+        return text
+    
+    def _parse_sections(self) -> Dict[str, HtmlElement]:
         """
         Parse all sections from the documentation.
         
@@ -42,44 +361,51 @@ class DocumentationParser:
         """
         sections = {}
         
-        markdown_div = self.soup.find('div', {'id': 'provider-doc'})
-        if not markdown_div:
+        markdown_div = self._get_provider_doc()
+        if markdown_div is None:
             # Check if this is a "Page Not Found" error
-            not_found = self.soup.find('h1', string=lambda t: t and 'Page Not Found' in t if t else False)
+            not_found = self._document.not_found or any(
+                PAGE_NOT_FOUND_TEXT in _get_text(h1) for h1 in self.tree.iter('h1')
+            )
             if not_found:
                     logger.warning("Page Not Found: The requested documentation page does not exist")
             else:
                 logger.error("Could not find main documentation div")
             return sections
         
-        h2_headers = markdown_div.find_all('h2')
+        h2_headers = list(markdown_div.iter('h2'))
         logger.bind(section_count=len(h2_headers)).debug("Found sections")
         
-        for i, header in enumerate(h2_headers):
-            section_name = header.get_text().strip()
-            
-            content_elements = []
-            current = header.find_next_sibling()
-            
-            next_h2 = h2_headers[i + 1] if i + 1 < len(h2_headers) else None
-            
-            while current:
-                if current.name == 'h2':
-                    break
-                if next_h2 and current == next_h2:
-                    break
-                    
-                content_elements.append(current)
-                current = current.find_next_sibling()
+        # Single forward pass over the children of each element holding
+        # headers (normally just the documentation div): every element is
+        # added to the bucket of the closest h2 before it
+        buckets: Dict[HtmlElement, List[HtmlElement]] = {}
+        for parent in dict.fromkeys(header.getparent() for header in h2_headers):
+            bucket = None
+            for child in parent:
+                # Skip comments and processing instructions
+                if not isinstance(child.tag, str):
+                    continue
+                if child.tag == 'h2':
+                    bucket = buckets[child] = [child]
+                elif bucket is not None:
+                    bucket.append(child)
+        
+        for header in h2_headers:
+            section_name = _get_text(header).strip()
             
-            section_wrapper = self.soup.new_tag('div')
-            section_wrapper.append(header)
-            for elem in content_elements:
-                if elem.name:
-                    section_wrapper.append(elem)
+            # Copy rather than move elements so the page tree stays intact
+            # for parsers sharing it (e.g. get_full_documentation)
+            section_wrapper = lxml_html.Element('div')
+            for elem in buckets[header]:
+                elem_copy = copy.deepcopy(elem)
+                elem_copy.tail = None
+                section_wrapper.append(elem_copy)
             
             sections[section_name] = section_wrapper
-            logger.bind(section=section_name).debug("Parsed section")
+        
+        # One record for the whole page rather than a bound logger per section
+        logger.bind(sections=list(sections)).debug("Parsed sections")
         
         return sections
     
@@ -93,11 +419,9 @@ class DocumentationParser:
         Returns:
             Section HTML as string, or None if not found
         """
-        section_name_lower = section_name.lower()
-        
-        for name, content in self.sections.items():
-            if name.lower() == section_name_lower:
-                return str(content)
+        content = self._sections_lower.get(section_name.lower())
+        if content is not None:
+            return self._section_html(content)
         
         logger.bind(section_name=section_name).warning("Section not found")
         return None
@@ -117,6 +441,48 @@ class DocumentationParser:
             result[name] = self.get_section(name)
         return result
     
+    def get_sections_batch(
+        self,
+        section_names: List[str],
+        as_text: bool = False
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get multiple sections by name in a single pass over the page's sections.
+        
+        Args:
+            section_names: List of section names (case-insensitive)
+            as_text: If True, return plain text instead of HTML
+            
+        Returns:
+            Dict mapping the requested names to their content (None if not found)
+        
+        Missing sections are logged like the single-section lookups do: with a
+        warning for HTML (``get_section``), silently for text (``get_section_text``).
+        """
+        render = self._section_text if as_text else self._section_html
+        
+        pending: Dict[str, List[str]] = {}
+        for name in section_names:
+            pending.setdefault(name.lower(), []).append(name)
+        
+        found: Dict[str, str] = {}
+        for name, content in self.sections.items():
+            requested = pending.pop(name.lower(), None)
+            if requested is None:
+                continue
+            rendered = render(content)
+            for requested_name in requested:
+                found[requested_name] = rendered
+            if not pending:
+                break
+        
+        result = {}
+        for name in section_names:
+            if name not in found and not as_text:
+                logger.bind(section_name=name).warning("Section not found")
+            result[name] = found.get(name)
+        return result
+    
     def get_all_sections(self) -> Dict[str, str]:
         """
         Get all sections as HTML strings.
@@ -124,7 +490,7 @@ class DocumentationParser:
         Returns:
             Dict mapping section names to their HTML content
         """
-        return {name: str(content) for name, content in self.sections.items()}
+        return {name: self._section_html(content) for name, content in self.sections.items()}
     
     def list_sections(self) -> List[str]:
         """
@@ -133,7 +499,16 @@ class DocumentationParser:
         Returns:
             List of section names
         """
-        return list(self.sections.keys())
+        return list(self.sections)
+    
+    def iter_section_names(self) -> Iterator[str]:
+        """
+        Iterate over the available section names without copying them.
+        
+        Returns:
+            Iterator over section names, in page order
+        """
+        return iter(self.sections)
     
     def get_sections_by_prefix(self, prefix: str) -> Dict[str, str]:
         """
@@ -145,14 +520,11 @@ class DocumentationParser:
         Returns:
             Dict mapping matching section names to their HTML content
         """
-        prefix_lower = prefix.lower()
-        matching_sections = {}
-        
-        for name, content in self.sections.items():
-            if name.lower().startswith(prefix_lower):
-                matching_sections[name] = str(content)
-        
-        return matching_sections
+        sections = self.sections
+        return {
+            name: self._section_html(sections[name])
+            for name in self._names_with_prefix(prefix)
+        }
     
     def get_sections_text_by_prefix(self, prefix: str) -> Dict[str, str]:
         """
@@ -164,15 +536,11 @@ class DocumentationParser:
         Returns:
             Dict mapping matching section names to their plain text content
         """
-        prefix_lower = prefix.lower()
-        matching_sections = {}
-        
-        for name, content in self.sections.items():
-            if name.lower().startswith(prefix_lower):
-                text = self._extract_readable_text(content)
-                matching_sections[name] = text
-        
-        return matching_sections
+        sections = self.sections
+        return {
+            name: self._section_text(sections[name])
+            for name in self._names_with_prefix(prefix)
+        }
     
     def get_section_text(self, section_name: str) -> Optional[str]:
         """
@@ -184,73 +552,32 @@ class DocumentationParser:
         Returns:
             Section text content, or None if not found
         """
-        section_name_lower = section_name.lower()
-        
-        for name, content in self.sections.items():
-            if name.lower() == section_name_lower:
-                return self._extract_readable_text(content)
+        content = self._sections_lower.get(section_name.lower())
+        if content is not None:
+            return self._section_text(content)
         
         return None
     
-    def _extract_readable_text(self, element: Tag) -> str:
+    def _extract_readable_text(self, element: HtmlElement) -> str:
         """
         Extract readable text from an element, preserving code blocks and structure.
         
         Args:
-            element: BeautifulSoup Tag element
+            element: lxml element
             
         Returns:
             Formatted text with preserved code blocks
         """
-        import re
-        
         output = []
         
-        for elem in element.children:
-            if not elem.name:
+        for elem in element:
+            if not isinstance(elem.tag, str):
                 continue
-                
-            if elem.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                text = elem.get_text(strip=True)
-                output.append(f"\n{'='*len(text)}\n{text}\n{'='*len(text)}\n")
-                
-            elif elem.name == 'p':
-                text = elem.get_text(strip=True)
-                if text:
-                    output.append(text + "\n")
-                    
-            elif elem.name in ['pre', 'code']:
-                code = elem.get_text()
-                output.append(f"\n```\n{code}\n```\n")
-                
-            elif elem.name == 'div':
-                code_elem = elem.find('pre') or elem.find('code')
-                if code_elem:
-                    code = code_elem.get_text()
-                    output.append(f"\n```\n{code}\n```\n")
-                else:
-                    text = elem.get_text(separator='\n', strip=True)
-                    if text:
-                        output.append(text + "\n")
-                        
-            elif elem.name in ['ul', 'ol']:
-                for li in elem.find_all('li', recursive=False):
-                    output.append(f"  • {li.get_text(strip=True)}\n")
-                output.append("\n")
-                
-            elif elem.name == 'blockquote':
-                text = elem.get_text(strip=True)
-                for line in text.split('\n'):
-                    output.append(f"> {line}\n")
-                output.append("\n")
-                
-            else:
-                text = elem.get_text(separator='\n', strip=True)
-                if text:
-                    output.append(text + "\n")
+            
+            handler = _TEXT_HANDLERS.get(elem.tag, _handle_default)
+            output.append(handler(elem))
         
-        result = ''.join(output)
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        result = _MULTI_NL.sub('\n\n', ''.join(output))
         
         return result.strip()
     
@@ -261,8 +588,27 @@ class DocumentationParser:
         Returns:
             Full documentation HTML as string
         """
-        markdown_div = self.soup.find('div', {'id': 'provider-doc'})
-        if markdown_div:
-            return str(markdown_div)
+        markdown_div = self._get_provider_doc()
+        if markdown_div is not None:
+            return _to_html(markdown_div)
         return None
+    
+    def get_full_documentation_text(self) -> Optional[str]:
+        """
+        Get the entire documentation content as plain text.
+        
+        Returns:
+            Full documentation text, one text piece per line
+        """
+        markdown_div = self._get_provider_doc()
+        if markdown_div is not None:
+            return _get_text(markdown_div, separator='\n', strip=True)
+        return None
+    
+    def _get_provider_doc(self) -> Optional[HtmlElement]:
+        """Find the main documentation div, or None if the page has none."""
+        if self._document.provider_doc is _NOT_SEARCHED:
+            matches = _find_provider_doc(self.tree)
+            self._document.provider_doc = matches[0] if matches else None
+        return self._document.provider_doc
 
@@ -1,28 +1,58 @@
 """URL parser for Terraform Registry resource documentation."""
 
 import re
-from typing import Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+from dataclasses import dataclass, fields
 from loguru import logger
 
 
-@dataclass
+_TERRAFORM_URL_RE = re.compile(
+    r"(?:https?://registry\.terraform\.io/providers/)?"
+    r"(?P<namespace>[\w-]+)/"
+    r"(?P<provider>[\w-]+)/"
+    r"(?P<version>[\w.-]+)/"
+    r"docs/resources/"
+    r"(?P<resource>[\w_]+)"
+)
+
+# Number of distinct URL strings whose parse results are kept
+PARSE_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
 class TerraformURL:
-    """Parsed Terraform Registry URL components."""
+    """Parsed Terraform Registry URL components (immutable, so parse results can be shared)."""
+    
+    # Slotted to drop the per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ("namespace", "provider", "version", "resource", "_url")
     
     namespace: str
     provider: str
     version: str
     resource: str
     
-    @property
-    def url(self) -> str:
-        """Construct full URL from components."""
-        return (
+    def __getstate__(self) -> Tuple[str, str, str, str]:
+        return (self.namespace, self.provider, self.version, self.resource)
+    
+    def __setstate__(self, state: Tuple[str, str, str, str]):
+        # Frozen instances reject setattr, so copy and pickle restore through object
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
+        self.__post_init__()
+    
+    def __post_init__(self):
+        # Built once, since the URL is read on every fetch and log line
+        object.__setattr__(self, "_url", (
             f"https://registry.terraform.io/providers/"
             f"{self.namespace}/{self.provider}/{self.version}/"
             f"docs/resources/{self.resource}"
-        )
+        ))
+    
+    @property
+    def url(self) -> str:
+        """Full URL built from the components."""
+        return self._url
     
     @classmethod
     def parse(cls, url: str) -> Optional["TerraformURL"]:
@@ -41,34 +71,10 @@ class TerraformURL:
             >>> tf_url.namespace
             'hashicorp'
         """
-        pattern = (
-            r"(?:https?://registry\.terraform\.io/providers/)?"
-            r"(?P<namespace>[\w-]+)/"
-            r"(?P<provider>[\w-]+)/"
-            r"(?P<version>[\w.-]+)/"
-            r"docs/resources/"
-            r"(?P<resource>[\w_]+)"
-        )
-        
-        match = re.search(pattern, url)
-        if not match:
+        tf_url = _parse_url(cls, url)
+        if tf_url is None:
             logger.bind(url=url).error("Invalid Terraform Registry URL format")
-            return None
-        
-        components = match.groupdict()
-        logger.bind(
-            namespace=components["namespace"],
-            provider=components["provider"],
-            version=components["version"],
-            resource=components["resource"]
-        ).debug("Parsed URL successfully")
-        
-        return cls(
-            namespace=components["namespace"],
-            provider=components["provider"],
-            version=components["version"],
-            resource=components["resource"]
-        )
+        return tf_url
     
     @classmethod
     def from_components(
@@ -97,3 +103,25 @@ class TerraformURL:
             resource=resource
         )
 
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_url(cls, url: str) -> Optional[TerraformURL]:
+    """Match a URL string once; repeated strings reuse the same TerraformURL."""
+    match = _TERRAFORM_URL_RE.search(url)
+    if not match:
+        return None
+    
+    components = match.groupdict()
+    logger.bind(
+        namespace=components["namespace"],
+        provider=components["provider"],
+        version=components["version"],
+        resource=components["resource"]
+    ).debug("Parsed URL successfully")
+    
+    return cls(
+        namespace=components["namespace"],
+        provider=components["provider"],
+        version=components["version"],
+        resource=components["resource"]
+    )
@@ -1,6 +1,10 @@
 """Specialized extractor for Argument Reference sections."""
 
-from typing import Optional
+import itertools
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+import requests
 from loguru import logger
 
 from ..generic.url_parser import TerraformURL
@@ -8,6 +12,13 @@ from ..generic.extractor import TerraformDocExtractor
 from ..generic.parser import DocumentationParser
 
 
+# Lines ending in ':' are subsection titles unless they are callouts like "Note:"
+_CALLOUT_RE = re.compile(r'note|warning|important', re.IGNORECASE)
+
+# First words of code blocks that hold real HCL rather than a bare value
+_HCL_KEYWORDS = ('resource', 'data', 'module', 'variable', 'output')
+
+
 class ArgumentReferenceExtractor:
     """
     Extracts and formats Argument Reference sections from Terraform documentation.
@@ -34,7 +45,9 @@ class ArgumentReferenceExtractor:
         self,
         headless: bool = True,
         timeout: int = 10,
-        wait_time: int = 2
+        wait_time: int = 2,
+        cache_dir: Optional[str] = None,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize the Argument Reference extractor.
@@ -42,15 +55,35 @@ class ArgumentReferenceExtractor:
         Args:
             headless: Run browser in headless mode
             timeout: Maximum time to wait for page elements
-            wait_time: Extra wait time after page load
+            wait_time: Maximum extra wait for the documentation to render
+            cache_dir: Directory for persisted pages (default: per-user cache dir)
+            http_session: Shared session for plain HTTP requests (see PageFetcher)
         """
         self.doc_extractor = TerraformDocExtractor(
             headless=headless,
             timeout=timeout,
-            wait_time=wait_time
+            wait_time=wait_time,
+            cache_dir=cache_dir,
+            http_session=http_session
         )
     
-    def extract(self, tf_url: TerraformURL, html: Optional[str] = None, heading_level: int = 1) -> Optional[str]:
+    def __enter__(self) -> "ArgumentReferenceExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the browser used for fetching."""
+        self.doc_extractor.close()
+    
+    def extract(
+        self,
+        tf_url: TerraformURL,
+        html: Optional[str] = None,
+        heading_level: int = 1,
+        as_markdown: bool = True
+    ) -> Optional[str]:
         """
         Extract Argument Reference section as formatted markdown.
         
@@ -58,9 +91,11 @@ class ArgumentReferenceExtractor:
             tf_url: TerraformURL object containing provider and resource info
             html: Optional pre-fetched HTML. If provided, skips fetching (more efficient).
             heading_level: Starting heading level (1 for #, 2 for ##, etc.)
+            as_markdown: If False, return the plain section text without markdown formatting
             
         Returns:
-            Formatted markdown string with argument reference, or None if not found
+            Formatted markdown string with argument reference (or the plain
+            section text if ``as_markdown`` is False), or None if not found
             
         Example:
             >>> url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
@@ -78,25 +113,25 @@ class ArgumentReferenceExtractor:
             resource=tf_url.resource
         ).info("Extracting Argument Reference")
         
-        # If HTML is provided, parse it directly
         if html:
             logger.debug("Using pre-fetched HTML")
-            parser = DocumentationParser(html)
-            content = parser.get_section_text("Argument Reference")
         else:
-            # Otherwise, fetch the HTML first
+            # Otherwise, fetch the HTML first (cached across calls)
             logger.debug("Fetching HTML")
-            result = self.doc_extractor.extract_sections(
-                tf_url.url,
-                ["Argument Reference"],
-                as_text=True
-            )
-            content = result.get("Argument Reference")
+            html = self.doc_extractor.fetch_html(tf_url.url)
+            if not html:
+                return None
+        
+        parser = DocumentationParser(html)
+        content = parser.get_section_text("Argument Reference")
         
         if not content:
             logger.bind(url=tf_url.url).warning("Argument Reference section not found")
             return None
         
+        if not as_markdown:
+            return content
+        
         markdown = self._format_as_markdown(tf_url, content, heading_level)
         
         logger.bind(
@@ -107,6 +142,49 @@ class ArgumentReferenceExtractor:
         
         return markdown
     
+    def extract_many(
+        self,
+        tf_urls: Iterable[TerraformURL],
+        heading_level: int = 1
+    ) -> Dict[str, Optional[str]]:
+        """
+        Extract Argument Reference for multiple resources with one browser.
+        
+        Pages are fetched concurrently, and any page needing JavaScript
+        rendering reuses the same WebDriver instead of launching a new one.
+        This call blocks, so it cannot be used inside a running event loop.
+        
+        Args:
+            tf_urls: TerraformURL objects to extract from
+            heading_level: Starting heading level (1 for #, 2 for ##, etc.)
+            
+        Returns:
+            Dict mapping each resource URL to its markdown (None if not found)
+            
+        Raises:
+            RuntimeError: If called while an event loop is running in this thread
+            
+        Example:
+            >>> urls = [
+            ...     TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb"),
+            ...     TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/s3_bucket")
+            ... ]
+            >>> with ArgumentReferenceExtractor() as extractor:
+            ...     arguments = extractor.extract_many(urls)
+        """
+        tf_urls = list(tf_urls)
+        pages = self.doc_extractor.fetcher.fetch_many_sync([tf_url.url for tf_url in tf_urls])
+        
+        results: Dict[str, Optional[str]] = {}
+        for tf_url, html in zip(tf_urls, pages):
+            if not html:
+                logger.bind(url=tf_url.url).error("Failed to fetch page")
+                results[tf_url.url] = None
+                continue
+            results[tf_url.url] = self.extract(tf_url, html=html, heading_level=heading_level)
+        
+        return results
+    
     def _format_as_markdown(self, tf_url: TerraformURL, content: str, heading_level: int = 1) -> str:
         """
         Format the extracted content as readable markdown.
@@ -120,28 +198,32 @@ class ArgumentReferenceExtractor:
             Formatted markdown string
         """
         lines = []
+        append = lines.append
         
         main_heading = "#" * heading_level
-        lines.append(f"{main_heading} Argument Reference: {tf_url.resource}")
-        lines.append("")
+        append(f"{main_heading} Argument Reference: {tf_url.resource}")
+        append("")
         
         content_lines = content.split('\n')
         in_code_block = False
         skip_next_code_block = False
         
-        # Subsection heading (one level deeper than main)
-        subsection_heading = "#" * (heading_level + 2)
+        # Subsection heading (two levels deeper than main), built once for the loop
+        subsection_prefix = "\n" + "#" * (heading_level + 2) + " "
+        
+        # Pair each line with the one after it, for the look-ahead at code fences
+        following_lines = itertools.chain(itertools.islice(content_lines, 1, None), ("",))
         
-        for i, line in enumerate(content_lines):
+        for line, following_line in zip(content_lines, following_lines):
             if line.strip() == '```':
                 if not in_code_block:
-                    next_line = content_lines[i + 1].strip() if i + 1 < len(content_lines) else ""
-                    if len(next_line.split()) <= 2 and not next_line.startswith(('resource', 'data', 'module', 'variable', 'output')):
+                    next_line = following_line.strip()
+                    if len(next_line.split()) <= 2 and not next_line.startswith(_HCL_KEYWORDS):
                         skip_next_code_block = True
                         in_code_block = True
                         continue
                     
-                    lines.append("```hcl")
+                    append("```hcl")
                     in_code_block = True
                 else:
                     if skip_next_code_block:
@@ -149,13 +231,13 @@ class ArgumentReferenceExtractor:
                         in_code_block = False
                         continue
                     
-                    lines.append("```")
+                    append("```")
                     in_code_block = False
             else:
                 if skip_next_code_block and in_code_block:
                     continue
                 
-                if line.startswith('=') and len(set(line.strip())) == 1:
+                if line.startswith('=') and not line.strip().strip('='):
                     continue
                 
                 stripped = line.lstrip()
@@ -163,27 +245,21 @@ class ArgumentReferenceExtractor:
                     indent_level = len(line) - len(stripped)
                     arg_text = stripped[2:].strip()
                     
-                    if '-' in arg_text:
-                        parts = arg_text.split('-', 1)
-                        arg_name = parts[0].strip()
-                        description = parts[1].strip() if len(parts) > 1 else ""
-                        
+                    arg_name, dash, description = arg_text.partition('-')
+                    if dash:
                         indent = ' ' * indent_level
-                        if indent_level == 0:
-                            lines.append(f"{indent}- **`{arg_name}`** - {description}")
-                        else:
-                            lines.append(f"{indent}- **`{arg_name}`** - {description}")
+                        append(f"{indent}- **`{arg_name.strip()}`** - {description.strip()}")
                     else:
-                        lines.append(f"- {arg_text}")
+                        append(f"- {arg_text}")
                 elif stripped and not in_code_block:
-                    if stripped.endswith(':') and not any(word in stripped.lower() for word in ['note', 'warning', 'important']):
-                        lines.append(f"\n{subsection_heading} {stripped[:-1]}\n")
+                    if stripped.endswith(':') and not _CALLOUT_RE.search(stripped):
+                        append(subsection_prefix + stripped[:-1] + "\n")
                     else:
-                        lines.append(line)
+                        append(line)
                 elif in_code_block:
-                    lines.append(line)
+                    append(line)
         
-        lines.append("")
+        append("")
         
         return '\n'.join(lines)
     
@@ -213,8 +289,7 @@ class ArgumentReferenceExtractor:
             return False
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(markdown)
+            Path(output_file).write_text(markdown, encoding='utf-8')
             
             logger.bind(output_file=output_file).info("Saved Argument Reference to file")
             return True
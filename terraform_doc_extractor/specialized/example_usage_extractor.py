@@ -1,6 +1,8 @@
 """Specialized extractor for Example Usage sections."""
 
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import requests
 from loguru import logger
 
 from ..generic.url_parser import TerraformURL
@@ -34,7 +36,9 @@ class ExampleUsageExtractor:
         self,
         headless: bool = True,
         timeout: int = 10,
-        wait_time: int = 2
+        wait_time: int = 2,
+        cache_dir: Optional[str] = None,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize the Example Usage extractor.
@@ -42,15 +46,35 @@ class ExampleUsageExtractor:
         Args:
             headless: Run browser in headless mode
             timeout: Maximum time to wait for page elements
-            wait_time: Extra wait time after page load
+            wait_time: Maximum extra wait for the documentation to render
+            cache_dir: Directory for persisted pages (default: per-user cache dir)
+            http_session: Shared session for plain HTTP requests (see PageFetcher)
         """
         self.doc_extractor = TerraformDocExtractor(
             headless=headless,
             timeout=timeout,
-            wait_time=wait_time
+            wait_time=wait_time,
+            cache_dir=cache_dir,
+            http_session=http_session
         )
     
-    def extract(self, tf_url: TerraformURL, html: Optional[str] = None, heading_level: int = 1) -> Optional[str]:
+    def __enter__(self) -> "ExampleUsageExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the browser used for fetching."""
+        self.doc_extractor.close()
+    
+    def extract(
+        self,
+        tf_url: TerraformURL,
+        html: Optional[str] = None,
+        heading_level: int = 1,
+        as_markdown: bool = True
+    ) -> Optional[str]:
         """
         Extract Example Usage section(s) as formatted markdown.
         
@@ -62,9 +86,12 @@ class ExampleUsageExtractor:
             tf_url: TerraformURL object containing provider and resource info
             html: Optional pre-fetched HTML. If provided, skips fetching (more efficient).
             heading_level: Starting heading level (1 for #, 2 for ##, etc.)
+            as_markdown: If False, return the plain section text (sections
+                separated by a blank line) without markdown formatting
             
         Returns:
-            Formatted markdown string with example usage, or None if not found
+            Formatted markdown string with example usage (or the plain
+            section text if ``as_markdown`` is False), or None if not found
             
         Example:
             >>> url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
@@ -82,43 +109,37 @@ class ExampleUsageExtractor:
             resource=tf_url.resource
         ).info("Extracting Example Usage")
         
-        # If HTML is provided, parse it directly
         if html:
             logger.debug("Using pre-fetched HTML")
-            parser = DocumentationParser(html)
-            
-            # Try to get all "Example Usage" sections (handles multiple sections)
-            example_sections = parser.get_sections_text_by_prefix("Example Usage")
-            
-            if not example_sections:
-                logger.bind(url=tf_url.url).warning("No Example Usage sections found")
-                return None
-            
-            # If multiple sections exist, combine them
-            if len(example_sections) > 1:
-                logger.bind(
-                    count=len(example_sections),
-                    sections=list(example_sections.keys())
-                ).info("Found multiple Example Usage sections")
-                markdown = self._format_multiple_sections(tf_url, example_sections, heading_level)
-            else:
-                # Single section
-                content = list(example_sections.values())[0]
-                markdown = self._format_as_markdown(tf_url, content, heading_level)
         else:
-            # Otherwise, fetch the HTML first
+            # Otherwise, fetch the HTML first (cached across calls)
             logger.debug("Fetching HTML")
-            result = self.doc_extractor.extract_sections(
-                tf_url.url,
-                ["Example Usage"],
-                as_text=True
-            )
-            content = result.get("Example Usage")
-            
-            if not content:
-                logger.bind(url=tf_url.url).warning("Example Usage section not found")
+            html = self.doc_extractor.fetch_html(tf_url.url)
+            if not html:
                 return None
-            
+        
+        parser = DocumentationParser(html)
+        
+        # Try to get all "Example Usage" sections (handles multiple sections)
+        example_sections = parser.get_sections_text_by_prefix("Example Usage")
+        
+        if not example_sections:
+            logger.bind(url=tf_url.url).warning("No Example Usage sections found")
+            return None
+        
+        if not as_markdown:
+            return '\n\n'.join(example_sections.values())
+        
+        # If multiple sections exist, combine them
+        if len(example_sections) > 1:
+            logger.bind(
+                count=len(example_sections),
+                sections=list(example_sections.keys())
+            ).info("Found multiple Example Usage sections")
+            markdown = self._format_multiple_sections(tf_url, example_sections, heading_level)
+        else:
+            # Single section
+            content = next(iter(example_sections.values()))
             markdown = self._format_as_markdown(tf_url, content, heading_level)
         
         logger.bind(
@@ -129,6 +150,49 @@ class ExampleUsageExtractor:
         
         return markdown
     
+    def extract_many(
+        self,
+        tf_urls: Iterable[TerraformURL],
+        heading_level: int = 1
+    ) -> Dict[str, Optional[str]]:
+        """
+        Extract Example Usage for multiple resources with one browser.
+        
+        Pages are fetched concurrently, and any page needing JavaScript
+        rendering reuses the same WebDriver instead of launching a new one.
+        This call blocks, so it cannot be used inside a running event loop.
+        
+        Args:
+            tf_urls: TerraformURL objects to extract from
+            heading_level: Starting heading level (1 for #, 2 for ##, etc.)
+            
+        Returns:
+            Dict mapping each resource URL to its markdown (None if not found)
+            
+        Raises:
+            RuntimeError: If called while an event loop is running in this thread
+            
+        Example:
+            >>> urls = [
+            ...     TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb"),
+            ...     TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/s3_bucket")
+            ... ]
+            >>> with ExampleUsageExtractor() as extractor:
+            ...     examples = extractor.extract_many(urls)
+        """
+        tf_urls = list(tf_urls)
+        pages = self.doc_extractor.fetcher.fetch_many_sync([tf_url.url for tf_url in tf_urls])
+        
+        results: Dict[str, Optional[str]] = {}
+        for tf_url, html in zip(tf_urls, pages):
+            if not html:
+                logger.bind(url=tf_url.url).error("Failed to fetch page")
+                results[tf_url.url] = None
+                continue
+            results[tf_url.url] = self.extract(tf_url, html=html, heading_level=heading_level)
+        
+        return results
+    
     def _format_multiple_sections(self, tf_url: TerraformURL, sections: dict, heading_level: int = 1) -> str:
         """
         Format multiple example usage sections into a single markdown document.
@@ -142,48 +206,65 @@ class ExampleUsageExtractor:
             Formatted markdown string with all sections
         """
         lines = []
+        append = lines.append
         
         # Main heading
         main_heading = "#" * heading_level
-        lines.append(f"{main_heading} Example Usage: {tf_url.resource}")
-        lines.append("")
+        append(f"{main_heading} Example Usage: {tf_url.resource}")
+        append("")
         
         # Process each section (subsections are one level deeper)
-        subsection_heading = "#" * (heading_level + 1)
+        subsection_prefix = "#" * (heading_level + 1) + " "
         for i, (section_name, content) in enumerate(sections.items()):
             # Extract the subsection name (e.g., "Basic" from "Example Usage - Basic")
             if " - " in section_name:
                 subsection = section_name.split(" - ", 1)[1]
-                lines.append(f"{subsection_heading} {subsection}")
+                append(subsection_prefix + subsection)
             else:
-                lines.append(f"{subsection_heading} Example {i + 1}")
+                append(f"{subsection_prefix}Example {i + 1}")
             
-            lines.append("")
+            append("")
             
-            content_lines = content.split('\n')
-            in_code_block = False
-            
-            for line in content_lines:
-                if line.strip() == '```':
-                    if not in_code_block:
-                        lines.append("```hcl")
-                        in_code_block = True
-                    else:
-                        lines.append("```")
-                        in_code_block = False
-                else:
-                    if line.startswith('=') and len(set(line.strip())) == 1:
-                        continue
-                    lines.append(line)
+            lines.extend(self._content_lines(content))
             
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            append("")
+            append("---")
+            append("")
         
-        lines.append(f"*Source: {tf_url.url}*")
+        append(f"*Source: {tf_url.url}*")
         
         return '\n'.join(lines)
     
+    @staticmethod
+    def _content_lines(content: str) -> List[str]:
+        """
+        Convert one section's text to markdown lines.
+        
+        Code fences are tagged as HCL and '=' underlines are dropped. Each
+        pass is skipped when a substring check shows there is nothing for it
+        to do, so plain prose is just split into lines.
+        
+        Args:
+            content: Raw text content of the section
+            
+        Returns:
+            Markdown lines for the section
+        """
+        lines = content.split('\n')
+        
+        if content.startswith('=') or '\n=' in content:
+            lines = [line for line in lines if line[:1] != '=' or line.rstrip().strip('=')]
+        
+        if '```' in content:
+            # Fences alternate between opening and closing a code block
+            in_code_block = False
+            for index, line in enumerate(lines):
+                if line.strip() == '```':
+                    lines[index] = "```" if in_code_block else "```hcl"
+                    in_code_block = not in_code_block
+        
+        return lines
+    
     def _format_as_markdown(self, tf_url: TerraformURL, content: str, heading_level: int = 1) -> str:
         """
         Format the extracted content as readable markdown.
@@ -197,28 +278,15 @@ class ExampleUsageExtractor:
             Formatted markdown string
         """
         lines = []
+        append = lines.append
         
         main_heading = "#" * heading_level
-        lines.append(f"{main_heading} Example Usage: {tf_url.resource}")
-        lines.append("")
-        
-        content_lines = content.split('\n')
-        in_code_block = False
-        
-        for line in content_lines:
-            if line.strip() == '```':
-                if not in_code_block:
-                    lines.append("```hcl")
-                    in_code_block = True
-                else:
-                    lines.append("```")
-                    in_code_block = False
-            else:
-                if line.startswith('=') and len(set(line.strip())) == 1:
-                    continue
-                lines.append(line)
+        append(f"{main_heading} Example Usage: {tf_url.resource}")
+        append("")
+        
+        lines.extend(self._content_lines(content))
         
-        lines.append("")
+        append("")
         
         return '\n'.join(lines)
     
@@ -248,8 +316,7 @@ class ExampleUsageExtractor:
             return False
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(markdown)
+            Path(output_file).write_text(markdown, encoding='utf-8')
             
             logger.bind(output_file=output_file).info("Saved Example Usage to file")
             return True
@@ -1,41 +1,62 @@
 """Facade class for easy access to specialized extractors."""
 
-from typing import Optional, Dict
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, Optional, Dict, Tuple
 from pathlib import Path
 from loguru import logger
 
 from ..generic.url_parser import TerraformURL
-from ..generic.fetcher import PageFetcher
+from ..generic.fetcher import FetcherPool, PageFetcher
+from ..generic.cache import BoundedHTMLCache
+from ..generic.parser import clear_parse_cache
 from .example_usage_extractor import ExampleUsageExtractor
 from .argument_reference_extractor import ArgumentReferenceExtractor
 
 
+# Default upper bound for the total size of cached pages (compressed bytes by default)
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Default output file names are the resource name followed by these
+EXAMPLES_FILE_SUFFIX = "_examples.md"
+ARGUMENTS_FILE_SUFFIX = "_arguments.md"
+
+
 class TerraformResourceDocs:
     """
     Facade class that provides a unified interface to extract both
     Example Usage and Argument Reference sections.
     
     This class optimizes extraction by caching fetched HTML. Multiple operations
-    on the same URL will reuse the cached HTML instead of re-fetching.
+    on the same URL will reuse the cached HTML instead of re-fetching. The
+    cache is bounded; the least recently used pages are evicted first.
+    
+    Browsers are started on the first fetch and kept running for later ones.
+    Call ``close()`` (or use the facade as a context manager) to shut them down.
     
     Example:
         >>> from terraform_doc_extractor import TerraformResourceDocs
         >>> 
-        >>> docs_extractor = TerraformResourceDocs()
-        >>> 
-        >>> # First call fetches HTML and caches it
-        >>> docs = docs_extractor.extract_all("hashicorp/aws/5.100.0/docs/resources/lb")
-        >>> 
-        >>> # Subsequent calls reuse cached HTML (no re-fetch!)
-        >>> docs_extractor.save_to_files("hashicorp/aws/5.100.0/docs/resources/lb", "output_dir")
-        >>> examples = docs_extractor.extract_examples("hashicorp/aws/5.100.0/docs/resources/lb")
+        >>> with TerraformResourceDocs() as docs_extractor:
+        ...     # First call fetches HTML and caches it
+        ...     docs = docs_extractor.extract_all("hashicorp/aws/5.100.0/docs/resources/lb")
+        ...     
+        ...     # Subsequent calls reuse cached HTML (no re-fetch!)
+        ...     docs_extractor.save_to_files("hashicorp/aws/5.100.0/docs/resources/lb", "output_dir")
+        ...     examples = docs_extractor.extract_examples("hashicorp/aws/5.100.0/docs/resources/lb")
     """
     
     def __init__(
         self,
         headless: bool = True,
         timeout: int = 10,
-        wait_time: int = 2
+        wait_time: int = 2,
+        cache_dir: Optional[str] = None,
+        cache_size: int = 128,
+        cache_max_bytes: Optional[int] = DEFAULT_CACHE_MAX_BYTES,
+        compress_cache: bool = True,
+        max_workers: int = 4
     ):
         """
         Initialize the facade with shared configuration.
@@ -43,13 +64,24 @@ class TerraformResourceDocs:
         Args:
             headless: Run browser in headless mode
             timeout: Maximum time to wait for page elements
-            wait_time: Extra wait time after page load
+            wait_time: Maximum extra wait for the documentation to render
+            cache_dir: Directory for the persistent HTML cache (default: per-user cache dir)
+            cache_size: Maximum number of pages kept in memory
+            cache_max_bytes: Maximum total size of pages kept in memory
+            compress_cache: Keep cached pages zlib-compressed in memory
+            max_workers: Number of resources processed in parallel by batch_extract
         """
-        # Single fetcher for all operations
-        self.fetcher = PageFetcher(
+        self.max_workers = max_workers
+        
+        # One fetcher (and browser) per worker, handed out for each fetch
+        self.fetcher_pool = FetcherPool(
+            size=max_workers,
             headless=headless,
             timeout=timeout,
-            wait_time=wait_time
+            wait_time=wait_time,
+            # Pages are cached in memory below; don't keep a second copy in the fetcher
+            cache_size=0,
+            disk_cache_dir=cache_dir
         )
         
         # Specialized parsers (don't need fetchers anymore)
@@ -57,10 +89,41 @@ class TerraformResourceDocs:
         self.argument_extractor = ArgumentReferenceExtractor()
         
         # Cache for fetched HTML: {url: html_content}
-        self._html_cache: Dict[str, str] = {}
+        self._html_cache = BoundedHTMLCache(
+            max_entries=cache_size,
+            max_bytes=cache_max_bytes,
+            compress=compress_cache
+        )
         
         logger.debug("Initialized TerraformResourceDocs with HTML caching")
     
+    @property
+    def fetcher(self) -> PageFetcher:
+        """
+        First fetcher of the pool (deprecated).
+        
+        Using it bypasses the pool, so it can drive the same browser as a
+        batch worker. Borrow one with ``fetcher_pool.fetcher()`` instead.
+        """
+        warnings.warn(
+            "TerraformResourceDocs.fetcher is deprecated; use fetcher_pool.fetcher() instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return self.fetcher_pool.fetchers[0]
+    
+    def __enter__(self) -> "TerraformResourceDocs":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Shut down the browsers started for fetching pages."""
+        self.fetcher_pool.close()
+        self.example_extractor.close()
+        self.argument_extractor.close()
+    
     def _get_html(self, tf_url: TerraformURL) -> Optional[str]:
         """
         Get HTML from cache or fetch it if not cached.
@@ -72,27 +135,32 @@ class TerraformResourceDocs:
             HTML content or None if fetch failed
         """
         # Check cache first
-        if tf_url.url in self._html_cache:
+        html = self._html_cache.get(tf_url.url)
+        if html is not None:
             logger.bind(url=tf_url.url).debug("Using cached HTML")
-            return self._html_cache[tf_url.url]
+            return html
         
-        # Not in cache, fetch it
+        # Not in cache, fetch it with whichever fetcher is free
         logger.bind(url=tf_url.url).info("Fetching HTML (not in cache)")
-        html = self.fetcher.fetch(tf_url.url)
+        with self.fetcher_pool.fetcher() as fetcher:
+            html = fetcher.fetch(tf_url.url)
         
         if html:
             # Cache it for future use
-            self._html_cache[tf_url.url] = html
+            self._html_cache.put(tf_url.url, html)
             logger.bind(url=tf_url.url, cache_size=len(self._html_cache)).debug("Cached HTML")
         
         return html
     
-    def clear_cache(self):
+    def clear_cache(self, disk: bool = False):
         """
-        Clear the HTML cache.
+        Clear the HTML cache and the parsed pages kept for reuse.
         
         Useful if you want to force re-fetching of pages.
         
+        Args:
+            disk: Also delete pages persisted in the disk cache
+        
         Example:
             >>> facade = TerraformDocumentationFacade()
             >>> docs = facade.extract_all("...")
@@ -100,7 +168,9 @@ class TerraformResourceDocs:
         """
         cache_size = len(self._html_cache)
         self._html_cache.clear()
-        logger.bind(cleared_entries=cache_size).info("Cleared HTML cache")
+        self.fetcher_pool.clear_cache(disk=disk)
+        clear_parse_cache()
+        logger.bind(cleared_entries=cache_size, disk=disk).info("Cleared HTML cache")
     
     def extract_all(self, url: str, heading_level: int = 1) -> Dict[str, Optional[str]]:
         """
@@ -213,7 +283,9 @@ class TerraformResourceDocs:
         output_dir: str = ".",
         examples_filename: Optional[str] = None,
         arguments_filename: Optional[str] = None,
-        heading_level: int = 1
+        heading_level: int = 1,
+        skip_if_exists: bool = False,
+        max_age: Optional[float] = None
     ) -> Dict[str, bool]:
         """
         Extract and save both sections to separate files.
@@ -226,6 +298,8 @@ class TerraformResourceDocs:
             examples_filename: Custom filename for examples (default: {resource}_examples.md)
             arguments_filename: Custom filename for arguments (default: {resource}_arguments.md)
             heading_level: Starting heading level (1 for #, 2 for ##, etc.)
+            skip_if_exists: Don't fetch the page if both files already exist
+            max_age: With skip_if_exists, only skip files modified within this many seconds
             
         Returns:
             Dictionary with keys 'examples' and 'arguments' indicating success (True/False)
@@ -249,15 +323,47 @@ class TerraformResourceDocs:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
+        return self._save_to_files_parsed(
+            tf_url, output_path, examples_filename, arguments_filename, heading_level,
+            skip_if_exists, max_age
+        )
+    
+    def _save_to_files_parsed(
+        self,
+        tf_url: TerraformURL,
+        output_path: Path,
+        examples_filename: Optional[str] = None,
+        arguments_filename: Optional[str] = None,
+        heading_level: int = 1,
+        skip_if_exists: bool = False,
+        max_age: Optional[float] = None
+    ) -> Dict[str, bool]:
+        """
+        Extract and save both sections of an already parsed URL.
+        
+        See ``save_to_files`` for the arguments and return value; the
+        output directory must already exist.
+        """
         # Generate filenames
         if not examples_filename:
-            examples_filename = f"{tf_url.resource}_examples.md"
+            examples_filename = tf_url.resource + EXAMPLES_FILE_SUFFIX
         if not arguments_filename:
-            arguments_filename = f"{tf_url.resource}_arguments.md"
+            arguments_filename = tf_url.resource + ARGUMENTS_FILE_SUFFIX
         
         examples_file = output_path / examples_filename
         arguments_file = output_path / arguments_filename
         
+        if (
+            skip_if_exists
+            and self._is_fresh(examples_file, max_age)
+            and self._is_fresh(arguments_file, max_age)
+        ):
+            logger.bind(
+                examples_file=str(examples_file),
+                arguments_file=str(arguments_file)
+            ).info("Output files already exist, skipping")
+            return {'examples': True, 'arguments': True}
+        
         logger.bind(
             examples_file=str(examples_file),
             arguments_file=str(arguments_file)
@@ -275,32 +381,45 @@ class TerraformResourceDocs:
         arguments_md = self.argument_extractor.extract(tf_url, html=html, heading_level=heading_level)
         
         # Save to files
-        examples_success = False
-        arguments_success = False
-        
-        if examples_md:
-            try:
-                with open(examples_file, 'w', encoding='utf-8') as f:
-                    f.write(examples_md)
-                examples_success = True
-                logger.bind(file=str(examples_file)).info("Saved Example Usage")
-            except Exception as e:
-                logger.bind(file=str(examples_file), error=str(e)).error("Failed to save file")
-        
-        if arguments_md:
-            try:
-                with open(arguments_file, 'w', encoding='utf-8') as f:
-                    f.write(arguments_md)
-                arguments_success = True
-                logger.bind(file=str(arguments_file)).info("Saved Argument Reference")
-            except Exception as e:
-                logger.bind(file=str(arguments_file), error=str(e)).error("Failed to save file")
-        
         return {
-            'examples': examples_success,
-            'arguments': arguments_success
+            'examples': self._write_file(examples_file, examples_md, "Example Usage"),
+            'arguments': self._write_file(arguments_file, arguments_md, "Argument Reference")
         }
     
+    @staticmethod
+    def _is_fresh(path: Path, max_age: Optional[float]) -> bool:
+        """Whether a file exists and, if max_age is given, was modified within max_age seconds."""
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return False
+        return max_age is None or time.time() - mtime <= max_age
+    
+    @staticmethod
+    def _write_file(path: Path, content: Optional[str], section: str) -> bool:
+        """
+        Write extracted markdown to a file.
+        
+        Args:
+            path: Output file path
+            content: Markdown to write; nothing is written if empty
+            section: Section name, for logging
+            
+        Returns:
+            True if the file was written, False otherwise
+        """
+        if not content:
+            return False
+        
+        try:
+            path.write_text(content, encoding='utf-8')
+        except Exception as e:
+            logger.bind(file=str(path), error=str(e)).error("Failed to save file")
+            return False
+        
+        logger.bind(file=str(path)).info(f"Saved {section}")
+        return True
+    
     def save_examples(
         self,
         url: str,
@@ -320,13 +439,9 @@ class TerraformResourceDocs:
             >>> facade = TerraformDocumentationFacade()
             >>> facade.save_examples("hashicorp/aws/5.100.0/docs/resources/lb", "lb_examples.md")
         """
-        tf_url = TerraformURL.parse(url)
-        
-        if not tf_url:
-            logger.bind(url=url).error("Failed to parse URL")
-            return False
-        
-        return self.example_extractor.extract_to_file(tf_url, output_file)
+        # Fetched through the shared pool and cache, like the other facade methods
+        examples = self.extract_examples(url)
+        return self._write_file(Path(output_file), examples, "Example Usage")
     
     def save_arguments(
         self,
@@ -347,25 +462,28 @@ class TerraformResourceDocs:
             >>> facade = TerraformDocumentationFacade()
             >>> facade.save_arguments("hashicorp/aws/5.100.0/docs/resources/lb", "lb_arguments.md")
         """
-        tf_url = TerraformURL.parse(url)
-        
-        if not tf_url:
-            logger.bind(url=url).error("Failed to parse URL")
-            return False
-        
-        return self.argument_extractor.extract_to_file(tf_url, output_file)
+        # Fetched through the shared pool and cache, like the other facade methods
+        arguments = self.extract_arguments(url)
+        return self._write_file(Path(output_file), arguments, "Argument Reference")
     
     def batch_extract(
         self,
         urls: list,
-        output_dir: str = "."
+        output_dir: str = ".",
+        skip_if_exists: bool = False,
+        max_age: Optional[float] = None
     ) -> Dict[str, Dict[str, bool]]:
         """
         Extract and save documentation for multiple resources.
         
+        Resources are processed in parallel by up to ``max_workers`` threads,
+        each fetching with its own browser. Duplicate URLs are processed once.
+        
         Args:
             urls: List of Terraform Registry URLs or paths
             output_dir: Directory to save all files
+            skip_if_exists: Don't fetch resources whose files already exist
+            max_age: With skip_if_exists, only skip files modified within this many seconds
             
         Returns:
             Dictionary mapping URLs to their extraction results
@@ -380,28 +498,95 @@ class TerraformResourceDocs:
             >>> for url, result in results.items():
             ...     print(f"{url}: examples={result['examples']}, arguments={result['arguments']}")
         """
-        results = {}
+        results = dict(self.batch_extract_iter(urls, output_dir, skip_if_exists, max_age))
         
-        logger.bind(count=len(urls)).info("Starting batch extraction")
+        # Report results in the order the URLs were given
+        return {url: results[url] for url in urls}
+    
+    def batch_extract_iter(
+        self,
+        urls: list,
+        output_dir: str = ".",
+        skip_if_exists: bool = False,
+        max_age: Optional[float] = None
+    ) -> Iterator[Tuple[str, Dict[str, bool]]]:
+        """
+        Extract and save documentation for multiple resources, yielding results as they finish.
         
-        for url in urls:
-            tf_url = TerraformURL.parse(url)
+        Takes the same arguments as ``batch_extract``. Duplicate URLs are
+        processed once. Closing the generator early cancels the resources
+        that have not started yet.
+        
+        Yields:
+            Tuples of URL and extraction result, in completion order, once per distinct URL
             
-            if not tf_url:
-                logger.bind(url=url).warning("Skipping invalid URL")
-                results[url] = {'examples': False, 'arguments': False}
-                continue
+        Example:
+            >>> facade = TerraformDocumentationFacade()
+            >>> for url, result in facade.batch_extract_iter(urls, "docs/aws"):
+            ...     print(f"{url}: examples={result['examples']}, arguments={result['arguments']}")
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if len(unique_urls) < len(urls):
+            logger.bind(duplicates=len(urls) - len(unique_urls)).info("Dropped duplicate URLs")
+        
+        logger.bind(count=len(unique_urls), workers=self.max_workers).info("Starting batch extraction")
+        
+        # Create the output directory once for the whole batch
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {
+            executor.submit(self._batch_extract_one, url, output_path, skip_if_exists, max_age): url
+            for url in unique_urls
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
             
-            result = self.save_to_files(url, output_dir)
-            results[url] = result
+            logger.info("Batch extraction complete")
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _batch_extract_one(
+        self,
+        url: str,
+        output_path: Path,
+        skip_if_exists: bool,
+        max_age: Optional[float]
+    ) -> Dict[str, bool]:
+        """
+        Extract and save documentation for one resource of a batch.
+        
+        Args:
+            url: Terraform Registry URL or path
+            output_path: Existing directory to save the files in
+            skip_if_exists: Don't fetch the page if both files already exist
+            max_age: With skip_if_exists, only skip files modified within this many seconds
             
-            logger.bind(
-                resource=tf_url.resource,
-                examples=result['examples'],
-                arguments=result['arguments']
-            ).info("Processed resource")
+        Returns:
+            Dictionary with keys 'examples' and 'arguments' indicating success (True/False)
+        """
+        tf_url = TerraformURL.parse(url)
         
-        logger.info("Batch extraction complete")
+        if not tf_url:
+            logger.bind(url=url).warning("Skipping invalid URL")
+            return {'examples': False, 'arguments': False}
+        
+        result = self._save_to_files_parsed(
+            tf_url, output_path, skip_if_exists=skip_if_exists, max_age=max_age
+        )
+        
+        # The page won't be used again, so keep memory flat over large batches
+        self._html_cache.pop(tf_url.url)
+        
+        logger.bind(
+            resource=tf_url.resource,
+            examples=result['examples'],
+            arguments=result['arguments']
+        ).info("Processed resource")
         
-        return results
+        return result
 
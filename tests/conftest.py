@@ -0,0 +1,55 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+import requests
+from terraform_doc_extractor import TerraformResourceDocs, TerraformURL
+
+
+# Resources the tests extract from, as registry paths and in derived forms
+LB_PATH = "hashicorp/aws/5.100.0/docs/resources/lb"
+LB_TF_URL = TerraformURL.parse(LB_PATH)
+LB_FULL_URL = LB_TF_URL.url
+BIGQUERY_DATASET_PATH = "hashicorp/google/latest/docs/resources/bigquery_dataset"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        help="Run tests that fetch pages from the Terraform Registry"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: requires access to the Terraform Registry")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless --run-network is given."""
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """One HTTP session for the whole run, so registry connections are reused."""
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def facade():
+    """One TerraformResourceDocs for the whole run, so pages are fetched once."""
+    with TerraformResourceDocs() as facade:
+        yield facade
+
+
+@pytest.fixture(scope="session")
+def lb_html(facade):
+    """Rendered aws_lb documentation page, fetched once for the whole run."""
+    with facade.fetcher_pool.fetcher() as fetcher:
+        return fetcher.fetch(LB_FULL_URL)
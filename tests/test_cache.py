@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for the HTML page caches."""
+
+import threading
+import pytest
+from terraform_doc_extractor.generic.cache import BoundedHTMLCache, DiskHTMLCache
+
+
+class TestBoundedHTMLCache:
+    """Test LRU behavior of BoundedHTMLCache."""
+    
+    def test_put_and_get(self):
+        """Test that stored pages can be read back."""
+        cache = BoundedHTMLCache()
+        cache.put("a", "<html>a</html>")
+        
+        assert cache.get("a") == "<html>a</html>"
+        assert "a" in cache
+        assert len(cache) == 1
+    
+    def test_missing_url(self):
+        """Test that unknown URLs return None."""
+        cache = BoundedHTMLCache()
+        assert cache.get("missing") is None
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used page is evicted when full."""
+        cache = BoundedHTMLCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        
+        # Touch "a" so "b" becomes the least recently used
+        cache.get("a")
+        cache.put("c", "C")
+        
+        assert len(cache) == 2
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+    
+    def test_evicts_over_max_bytes(self):
+        """Test that pages are evicted once their total size exceeds max_bytes."""
+        cache = BoundedHTMLCache(max_bytes=10)
+        cache.put("a", "x" * 4)
+        cache.put("b", "x" * 4)
+        cache.put("a", "x" * 5)
+        
+        # Replacing "a" made "b" the least recently used page
+        cache.put("c", "x" * 4)
+        assert "a" in cache
+        assert "b" not in cache
+        
+        # A page larger than max_bytes still replaces everything else
+        cache.put("d", "x" * 20)
+        assert len(cache) == 1
+        assert "d" in cache
+    
+    def test_disabled_cache(self):
+        """Test that a cache with max_entries=0 stores nothing."""
+        cache = BoundedHTMLCache(max_entries=0, compress=True)
+        cache.put("a", "A")
+        
+        assert len(cache) == 0
+        assert cache.get("a") is None
+    
+    def test_compressed_pages(self):
+        """Test that compressed pages read back unchanged and count at their compressed size."""
+        html = "<html>" + "<p>• repeated</p>" * 1000 + "</html>"
+        cache = BoundedHTMLCache(max_bytes=len(html) // 2, compress=True)
+        cache.put("a", html)
+        cache.put("b", html)
+        
+        assert cache.get("a") == html
+        assert len(cache) == 2
+        assert cache.pop("b") == html
+    
+    def test_concurrent_access(self):
+        """Test that reads and evicting writes from several threads don't interfere."""
+        cache = BoundedHTMLCache(max_entries=8)
+        errors = []
+        
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    url = str((i + offset) % 16)
+                    cache.put(url, url)
+                    value = cache.get(url)
+                    assert value is None or value == url
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert len(cache) == 8
+    
+    def test_pop_and_clear(self):
+        """Test removing single pages and clearing the cache."""
+        cache = BoundedHTMLCache()
+        cache.put("a", "A")
+        cache.put("b", "B")
+        
+        assert cache.pop("a") == "A"
+        assert cache.pop("a") is None
+        
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestDiskHTMLCache:
+    """Test persistence of DiskHTMLCache."""
+    
+    def test_put_and_get_across_instances(self, tmp_path):
+        """Test that pages survive in the directory for a new cache instance."""
+        DiskHTMLCache(str(tmp_path)).put("hashicorp/aws/5.100.0/lb", "<html>•</html>")
+        
+        assert DiskHTMLCache(str(tmp_path)).get("hashicorp/aws/5.100.0/lb") == "<html>•</html>"
+    
+    def test_missing_key(self, tmp_path):
+        """Test that unknown keys return None."""
+        assert DiskHTMLCache(str(tmp_path / "missing")).get("nothing") is None
+    
+    def test_corrupt_entry_is_ignored(self, tmp_path):
+        """Test that unreadable files are treated as cache misses."""
+        cache = DiskHTMLCache(str(tmp_path))
+        cache.put("key", "<html></html>")
+        cache._path("key").write_bytes(b"not gzip")
+        
+        assert cache.get("key") is None
+    
+    def test_clear(self, tmp_path):
+        """Test that clearing removes all stored pages."""
+        cache = DiskHTMLCache(str(tmp_path))
+        cache.put("a", "A")
+        cache.clear()
+        
+        assert cache.get("a") is None
+    
+    def test_validators(self, tmp_path):
+        """Test that validators are stored with a page and dropped when it is replaced."""
+        cache = DiskHTMLCache(str(tmp_path))
+        assert cache.get_validators("a") == {}
+        
+        cache.put("a", "A", {"etag": '"v1"'})
+        assert DiskHTMLCache(str(tmp_path)).get_validators("a") == {"etag": '"v1"'}
+        
+        cache.put("a", "B")
+        assert cache.get_validators("a") == {}
+        
+        cache.put("a", "C", {"etag": '"v2"'})
+        cache.clear()
+        assert cache.get_validators("a") == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
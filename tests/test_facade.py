@@ -9,14 +9,10 @@ from terraform_doc_extractor import TerraformResourceDocs
 logger.disable("terraform_doc_extractor")
 
 
+@pytest.mark.network
 class TestFacadeBasics:
     """Test basic facade operations."""
     
-    @pytest.fixture
-    def facade(self):
-        """Create a TerraformResourceDocs instance."""
-        return TerraformResourceDocs()
-    
     def test_extract_all(self, facade):
         """Test extracting both sections at once."""
         docs = facade.extract_all("hashicorp/aws/5.100.0/docs/resources/lb")
@@ -65,13 +61,15 @@ class TestFacadeBasics:
         assert docs['arguments'].startswith("### Argument Reference:")
 
 
+@pytest.mark.network
 class TestFacadeCaching:
     """Test HTML caching functionality."""
     
     @pytest.fixture
     def facade(self):
-        """Create a TerraformResourceDocs instance."""
-        return TerraformResourceDocs()
+        """Create a fresh TerraformResourceDocs, since these tests count cache entries."""
+        with TerraformResourceDocs() as facade:
+            yield facade
     
     def test_html_caching(self, facade):
         """Test that HTML caching works."""
@@ -139,16 +137,12 @@ class TestFacadeCaching:
 class TestFacadeEdgeCases:
     """Test edge cases and error handling."""
     
-    @pytest.fixture
-    def facade(self):
-        """Create a TerraformResourceDocs instance."""
-        return TerraformResourceDocs()
-    
     def test_invalid_url(self, facade):
         """Test handling of completely invalid URL."""
         examples = facade.extract_examples("invalid/malformed/url")
         assert examples is None
     
+    @pytest.mark.network
     def test_nonexistent_resource(self, facade):
         """Test handling of non-existent resource (e.g., aws_alb)."""
         # aws_alb exists in schema but not in documentation
@@ -8,6 +8,9 @@ from terraform_doc_extractor import TerraformDocExtractor
 # Disable logging for tests
 logger.disable("terraform_doc_extractor")
 
+# Every test here fetches pages from the registry
+pytestmark = pytest.mark.network
+
 
 class TestGenericExtractor:
     """Test the generic TerraformDocExtractor."""
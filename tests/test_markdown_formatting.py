@@ -3,23 +3,40 @@
 
 import pytest
 from loguru import logger
-from terraform_doc_extractor import TerraformResourceDocs
+
+from .conftest import BIGQUERY_DATASET_PATH, LB_PATH
 
 # Disable logging for tests
 logger.disable("terraform_doc_extractor")
 
+# Every test here fetches pages from the registry
+pytestmark = pytest.mark.network
+
+
+@pytest.fixture(scope="module")
+def lb_examples(facade):
+    """Example Usage of aws_lb, extracted once for all tests."""
+    return facade.extract_examples(LB_PATH)
+
+
+@pytest.fixture(scope="module")
+def lb_arguments(facade):
+    """Argument Reference of aws_lb, extracted once for all tests."""
+    return facade.extract_arguments(LB_PATH)
+
+
+@pytest.fixture(scope="module")
+def bigquery_examples(facade):
+    """Example Usage of google_bigquery_dataset (multiple sections), extracted once."""
+    return facade.extract_examples(BIGQUERY_DATASET_PATH)
+
 
 class TestMarkdownFormatting:
     """Test markdown formatting quality."""
     
-    @pytest.fixture
-    def facade(self):
-        """Create a TerraformResourceDocs instance."""
-        return TerraformResourceDocs()
-    
-    def test_code_blocks_formatted(self, facade):
+    def test_code_blocks_formatted(self, lb_examples):
         """Test that code blocks are properly formatted."""
-        examples = facade.extract_examples("hashicorp/aws/5.100.0/docs/resources/lb")
+        examples = lb_examples
         
         # Check for HCL code blocks
         assert "```hcl" in examples
@@ -28,9 +45,9 @@ class TestMarkdownFormatting:
         close_count = examples.count("```") - hcl_count  # Total ``` minus opening ```hcl
         assert hcl_count == close_count
     
-    def test_arguments_formatted(self, facade):
+    def test_arguments_formatted(self, lb_arguments):
         """Test that arguments are properly formatted."""
-        arguments = facade.extract_arguments("hashicorp/aws/5.100.0/docs/resources/lb")
+        arguments = lb_arguments
         
         # Check for bold code-formatted arguments
         assert "**`" in arguments
@@ -41,10 +58,7 @@ class TestMarkdownFormatting:
     
     def test_heading_hierarchy(self, facade):
         """Test that heading hierarchy is maintained."""
-        examples = facade.extract_examples(
-            "hashicorp/google/latest/docs/resources/bigquery_dataset",
-            heading_level=1
-        )
+        examples = facade.extract_examples(BIGQUERY_DATASET_PATH, heading_level=1)
         
         # Main heading should be #
         assert examples.startswith("# Example Usage:")
@@ -55,46 +69,36 @@ class TestMarkdownFormatting:
     
     def test_heading_hierarchy_level_2(self, facade):
         """Test heading hierarchy with custom level."""
-        examples = facade.extract_examples(
-            "hashicorp/google/latest/docs/resources/bigquery_dataset",
-            heading_level=2
-        )
+        examples = facade.extract_examples(BIGQUERY_DATASET_PATH, heading_level=2)
         
         # Main heading should be ##
         assert examples.startswith("## Example Usage:")
         # Subsections should be ###
         assert "\n### " in examples
     
-    def test_no_trailing_whitespace(self, facade):
+    def test_no_trailing_whitespace(self, lb_examples):
         """Test that there's no excessive trailing whitespace."""
-        examples = facade.extract_examples("hashicorp/aws/5.100.0/docs/resources/lb")
-        
         # Should not end with multiple newlines
-        assert not examples.endswith("\n\n\n")
+        assert not lb_examples.endswith("\n\n\n")
     
-    def test_no_metadata_in_output(self, facade):
+    def test_no_metadata_in_output(self, lb_examples, lb_arguments):
         """Test that Provider/Version/Resource metadata is not included."""
-        examples = facade.extract_examples("hashicorp/aws/5.100.0/docs/resources/lb")
-        arguments = facade.extract_arguments("hashicorp/aws/5.100.0/docs/resources/lb")
-        
         # Check examples
-        assert "**Provider:**" not in examples
-        assert "**Version:**" not in examples
+        assert "**Provider:**" not in lb_examples
+        assert "**Version:**" not in lb_examples
         
         # Check arguments
-        assert "**Provider:**" not in arguments
-        assert "**Version:**" not in arguments
+        assert "**Provider:**" not in lb_arguments
+        assert "**Version:**" not in lb_arguments
     
-    def test_list_formatting(self, facade):
+    def test_list_formatting(self, lb_arguments):
         """Test that lists are properly formatted."""
-        arguments = facade.extract_arguments("hashicorp/aws/5.100.0/docs/resources/lb")
-        
         # Should have bullet points for arguments
-        assert "\n- " in arguments or "\n  - " in arguments
+        assert "\n- " in lb_arguments or "\n  - " in lb_arguments
     
-    def test_no_html_tags(self, facade):
+    def test_no_html_tags(self, lb_examples):
         """Test that HTML tags are not present in text output."""
-        examples = facade.extract_examples("hashicorp/aws/5.100.0/docs/resources/lb")
+        examples = lb_examples
         
         # Should not contain common HTML tags
         assert "<div" not in examples
@@ -106,16 +110,9 @@ class TestMarkdownFormatting:
 class TestMultipleExamplesFormatting:
     """Test formatting of resources with multiple example sections."""
     
-    @pytest.fixture
-    def facade(self):
-        """Create a TerraformResourceDocs instance."""
-        return TerraformResourceDocs()
-    
-    def test_multiple_sections_structure(self, facade):
+    def test_multiple_sections_structure(self, bigquery_examples):
         """Test that multiple sections are properly structured."""
-        examples = facade.extract_examples(
-            "hashicorp/google/latest/docs/resources/bigquery_dataset"
-        )
+        examples = bigquery_examples
         
         # Should have main heading
         assert "# Example Usage: bigquery_dataset" in examples
@@ -123,11 +120,9 @@ class TestMultipleExamplesFormatting:
         subsection_count = examples.count("\n## ")
         assert subsection_count >= 2
     
-    def test_subsection_names(self, facade):
+    def test_subsection_names(self, bigquery_examples):
         """Test that subsection names are properly extracted."""
-        examples = facade.extract_examples(
-            "hashicorp/google/latest/docs/resources/bigquery_dataset"
-        )
+        examples = bigquery_examples
         
         # Should have recognizable subsection names
         lines = examples.split('\n')
@@ -140,11 +135,9 @@ class TestMultipleExamplesFormatting:
             # Should not start with "Example Usage" (that's the main heading)
             assert not subsection.startswith("Example Usage:")
     
-    def test_each_subsection_has_content(self, facade):
+    def test_each_subsection_has_content(self, bigquery_examples):
         """Test that each subsection has content."""
-        examples = facade.extract_examples(
-            "hashicorp/google/latest/docs/resources/bigquery_dataset"
-        )
+        examples = bigquery_examples
         
         # Split by subsections
         sections = examples.split("\n## ")
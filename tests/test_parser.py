@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Tests for DocumentationParser using inline HTML (no network access)."""
+
+import pytest
+from bs4 import BeautifulSoup
+from loguru import logger
+from terraform_doc_extractor import DocumentationParser
+from terraform_doc_extractor.generic import parser as parser_module
+from terraform_doc_extractor.generic.parser import clear_parse_cache
+
+# Disable logging for tests
+logger.disable("terraform_doc_extractor")
+
+
+SAMPLE_HTML = """
+<html><body>
+<div id="provider-doc">
+<h1>Resource: aws_lb</h1>
+<p>Provides a Load Balancer resource.</p>
+<h2>Example Usage</h2>
+<pre><code>resource "aws_lb" "test" {}</code></pre>
+<h2>Argument Reference</h2>
+<p>The following arguments are supported:</p>
+<ul>
+<li><code>name</code> - (Optional) Name of the LB.</li>
+<li><code>internal</code> - (Optional) If true, the LB will be internal.</li>
+</ul>
+<h2>Attribute Reference</h2>
+<ul><li><code>arn</code> - ARN of the load balancer.</li></ul>
+</div>
+</body></html>
+"""
+
+
+class TestDocumentationParser:
+    """Test section parsing and lookup."""
+    
+    @pytest.fixture
+    def parser(self):
+        """Create a parser for the sample page."""
+        return DocumentationParser(SAMPLE_HTML)
+    
+    def test_list_sections(self, parser):
+        """Test that h2 headers define the sections, in page order."""
+        assert parser.list_sections() == [
+            "Example Usage",
+            "Argument Reference",
+            "Attribute Reference"
+        ]
+    
+    def test_get_section_case_insensitive(self, parser):
+        """Test that section lookup ignores case."""
+        html = parser.get_section("argument reference")
+        assert html is not None
+        assert "<code>name</code>" in html
+        assert parser.get_section("ARGUMENT REFERENCE") == html
+    
+    def test_get_missing_section(self, parser):
+        """Test that unknown sections return None."""
+        assert parser.get_section("Nonexistent Section") is None
+        assert parser.get_section_text("Nonexistent Section") is None
+    
+    def test_section_does_not_include_next_section(self, parser):
+        """Test that a section stops at the next h2 header."""
+        text = parser.get_section_text("Argument Reference")
+        assert "name" in text
+        assert "arn" not in text
+    
+    def test_section_text(self, parser):
+        """Test plain-text rendering of lists and code blocks."""
+        text = parser.get_section_text("Example Usage")
+        assert "```" in text
+        assert 'resource "aws_lb" "test" {}' in text
+        
+        text = parser.get_section_text("Argument Reference")
+        assert "  • name- (Optional) Name of the LB." in text
+    
+    def test_text_matches_beautifulsoup(self):
+        """Test that script, style and template contents are skipped like BeautifulSoup does."""
+        html = SAMPLE_HTML.replace(
+            "<p>The following arguments are supported:</p>",
+            '<p id="mixed">The following<script>var x;</script><style>p {}</style>'
+            "<template>hidden</template> arguments are supported:</p>"
+        )
+        text = DocumentationParser(html).get_section_text("Argument Reference")
+        expected = BeautifulSoup(html, "lxml").find(id="mixed").get_text(strip=True)
+        
+        assert expected in text
+        assert "var x" not in text
+        assert "hidden" not in text
+    
+    def test_deprecated_soup(self, parser):
+        """Test that the old BeautifulSoup attribute still works, with a warning."""
+        with pytest.warns(DeprecationWarning):
+            soup = parser.soup
+        assert soup.find("div", {"id": "provider-doc"}) is not None
+    
+    def test_parsers_share_parsed_page(self, parser):
+        """Test that parsers built from the same HTML reuse one parse tree."""
+        assert DocumentationParser(SAMPLE_HTML).tree is parser.tree
+        assert DocumentationParser(SAMPLE_HTML + " ").tree is not parser.tree
+    
+    def test_parse_cache_bounds(self, parser, monkeypatch):
+        """Test that the shared parse cache can be cleared and skips pages over its size limit."""
+        clear_parse_cache()
+        assert DocumentationParser(SAMPLE_HTML).tree is not parser.tree
+        
+        monkeypatch.setattr(parser_module, "PARSED_DOCUMENT_CACHE_MAX_BYTES", 10)
+        html = SAMPLE_HTML + "  "
+        assert DocumentationParser(html).tree is not DocumentationParser(html).tree
+    
+    def test_rendered_sections_are_reused(self, parser):
+        """Test that sections are serialized once and shared between parsers."""
+        html = parser.get_section("Argument Reference")
+        text = parser.get_section_text("Argument Reference")
+        
+        other = DocumentationParser(SAMPLE_HTML)
+        assert other.get_all_sections()["Argument Reference"] is html
+        assert other.get_sections_text_by_prefix("Argument")["Argument Reference"] is text
+    
+    def test_get_sections_batch(self, parser):
+        """Test that batch lookup matches individual lookups."""
+        names = ["attribute reference", "Example Usage", "Nonexistent Section"]
+        assert parser.get_sections_batch(names) == parser.get_sections(names)
+        
+        texts = parser.get_sections_batch(names, as_text=True)
+        assert texts == {name: parser.get_section_text(name) for name in names}
+    
+    def test_get_sections_by_prefix(self, parser):
+        """Test prefix matching of section names."""
+        sections = parser.get_sections_by_prefix("a")
+        assert list(sections) == ["Argument Reference", "Attribute Reference"]
+    
+    def test_full_documentation_unaffected_by_sections(self, parser):
+        """Test that parsing sections leaves the full page intact."""
+        parser.list_sections()
+        full = DocumentationParser(SAMPLE_HTML).get_full_documentation()
+        assert "Example Usage" in full
+        assert "Argument Reference" in full
+    
+    def test_missing_documentation_div(self):
+        """Test that pages without documentation yield no sections."""
+        parser = DocumentationParser("<html><body><h1>Page Not Found</h1></body></html>")
+        assert parser.list_sections() == []
+        assert parser.get_full_documentation() is None
+    
+    def test_not_found_text_inside_documentation(self):
+        """Test that documentation mentioning "Page Not Found" is still parsed."""
+        html = SAMPLE_HTML.replace("Name of the LB.", "Page Not Found message.")
+        parser = DocumentationParser(html)
+        assert "Argument Reference" in parser.list_sections()
+        assert "Page Not Found message." in parser.get_section_text("Argument Reference")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
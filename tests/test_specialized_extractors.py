@@ -1,44 +1,49 @@
 #!/usr/bin/env python3
 """Tests for specialized extractors."""
 
+import re
 import pytest
 from loguru import logger
 from terraform_doc_extractor import (
-    TerraformURL,
     ExampleUsageExtractor,
     ArgumentReferenceExtractor
 )
 
+from .conftest import BIGQUERY_DATASET_PATH, LB_TF_URL
+
 # Disable logging for tests
 logger.disable("terraform_doc_extractor")
 
 
+@pytest.mark.network
 class TestExampleUsageExtractor:
     """Test ExampleUsageExtractor."""
     
-    @pytest.fixture
-    def extractor(self):
-        """Create an ExampleUsageExtractor instance."""
-        return ExampleUsageExtractor()
+    @pytest.fixture(scope="class")
+    def extractor(self, http_session):
+        """Create an ExampleUsageExtractor shared by the class, closing its browser afterwards."""
+        with ExampleUsageExtractor(http_session=http_session) as extractor:
+            yield extractor
+    
+    @pytest.fixture(scope="class")
+    def lb_example_markdown(self, extractor, lb_html):
+        """Example Usage markdown of the lb page, extracted once for the class."""
+        return extractor.extract(LB_TF_URL, html=lb_html)
     
     def test_single_example_section(self, extractor):
-        """Test extraction of single example usage section."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url)
+        """Test extraction of single example usage section (fetching the page itself)."""
+        markdown = extractor.extract(LB_TF_URL)
         
         assert markdown is not None
         assert "# Example Usage: lb" in markdown
         assert "```hcl" in markdown
     
-    def test_multiple_example_sections(self, extractor):
+    def test_multiple_example_sections(self, facade):
         """Test handling of multiple example usage sections."""
         # Note: This test uses the facade instead of direct extractor
         # because direct extractor without pre-fetched HTML may not work
         # in standalone mode. Use TerraformResourceDocs for better reliability.
-        from terraform_doc_extractor import TerraformResourceDocs
-        
-        facade = TerraformResourceDocs()
-        markdown = facade.extract_examples("hashicorp/google/latest/docs/resources/bigquery_dataset")
+        markdown = facade.extract_examples(BIGQUERY_DATASET_PATH)
         
         if markdown is None:
             pytest.skip("Could not fetch documentation (network issue or page not found)")
@@ -49,45 +54,51 @@ class TestExampleUsageExtractor:
         # Should have multiple subsections
         assert markdown.count("\n## ") >= 2
     
-    def test_custom_heading_level(self, extractor):
+    def test_custom_heading_level(self, extractor, lb_html):
         """Test custom heading level."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url, heading_level=2)
+        markdown = extractor.extract(LB_TF_URL, html=lb_html, heading_level=2)
         
         assert markdown is not None
         assert markdown.startswith("## Example Usage:")
     
-    def test_code_blocks_formatted(self, extractor):
+    def test_code_blocks_formatted(self, lb_example_markdown):
         """Test that code blocks are properly formatted."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url)
+        markdown = lb_example_markdown
+        
+        # Language tag of every fence, collected in one pass
+        fences = re.findall(r"```(\w*)", markdown)
         
         # Check for HCL code blocks
-        assert "```hcl" in markdown
+        assert "hcl" in fences
         # Ensure code blocks are closed
-        assert markdown.count("```hcl") <= markdown.count("```") // 2
+        assert 2 * fences.count("hcl") <= len(fences)
     
-    def test_no_metadata(self, extractor):
+    def test_no_metadata(self, lb_example_markdown):
         """Test that Provider/Version/Resource metadata is not included."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url)
+        markdown = lb_example_markdown
         
         assert "**Provider:**" not in markdown
         assert "**Version:**" not in markdown
 
 
+@pytest.mark.network
 class TestArgumentReferenceExtractor:
     """Test ArgumentReferenceExtractor."""
     
-    @pytest.fixture
-    def extractor(self):
-        """Create an ArgumentReferenceExtractor instance."""
-        return ArgumentReferenceExtractor()
+    @pytest.fixture(scope="class")
+    def extractor(self, http_session):
+        """Create an ArgumentReferenceExtractor shared by the class, closing its browser afterwards."""
+        with ArgumentReferenceExtractor(http_session=http_session) as extractor:
+            yield extractor
+    
+    @pytest.fixture(scope="class")
+    def lb_argument_markdown(self, extractor, lb_html):
+        """Argument Reference markdown of the lb page, extracted once for the class."""
+        return extractor.extract(LB_TF_URL, html=lb_html)
     
     def test_argument_extraction(self, extractor):
-        """Test basic argument reference extraction."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url)
+        """Test basic argument reference extraction (fetching the page itself)."""
+        markdown = extractor.extract(LB_TF_URL)
         
         assert markdown is not None
         assert "# Argument Reference: lb" in markdown
@@ -95,28 +106,23 @@ class TestArgumentReferenceExtractor:
         assert "**`" in markdown
         assert "`**" in markdown
     
-    def test_custom_heading_level(self, extractor):
+    def test_custom_heading_level(self, extractor, lb_html):
         """Test custom heading level."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url, heading_level=3)
+        markdown = extractor.extract(LB_TF_URL, html=lb_html, heading_level=3)
         
         assert markdown is not None
         assert markdown.startswith("### Argument Reference:")
     
-    def test_nested_arguments(self, extractor):
+    def test_nested_arguments(self, lb_argument_markdown):
         """Test that nested arguments are properly formatted."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url)
+        markdown = lb_argument_markdown
         
         # Should have indented arguments (nested blocks)
-        lines = markdown.split('\n')
-        indented_args = [line for line in lines if line.startswith('  - **`')]
-        assert len(indented_args) > 0
+        assert re.search(r"(?m)^  - \*\*`", markdown) is not None
     
-    def test_no_metadata(self, extractor):
+    def test_no_metadata(self, lb_argument_markdown):
         """Test that Provider/Version/Resource metadata is not included."""
-        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
-        markdown = extractor.extract(url)
+        markdown = lb_argument_markdown
         
         assert "**Provider:**" not in markdown
         assert "**Version:**" not in markdown
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Tests for URL parsing functionality."""
 
+import copy
+import pickle
 import pytest
 from terraform_doc_extractor import TerraformURL
 
@@ -57,6 +59,14 @@ class TestURLParsing:
         url = TerraformURL.parse(original)
         assert url is not None
         assert url.url == f"https://registry.terraform.io/providers/{original}"
+    
+    def test_copy_and_pickle(self):
+        """Test that parsed URLs survive copying and pickling despite being frozen."""
+        url = TerraformURL.parse("hashicorp/aws/5.100.0/docs/resources/lb")
+        
+        assert copy.copy(url) == url
+        assert pickle.loads(pickle.dumps(url)) == url
+        assert pickle.loads(pickle.dumps(url)).url == url.url
 
 
 if __name__ == "__main__":